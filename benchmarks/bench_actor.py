@@ -0,0 +1,115 @@
+"""Benchmark: wallet actor latency and throughput across micro-batch sizes.
+
+`--threads` submitter threads share one wallet. Each submits `--count` operations in
+windows of `--window` outstanding requests and waits for every future, recording the
+submit-to-result latency. The baseline serialises the same calls with a `threading.Lock`
+around the wallet's own `deposit`/`withdraw`.
+
+Run with `uv run python benchmarks/bench_actor.py [--threads N] [--count N] [--window N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from decimal import Decimal
+
+from hedix_wallet.application.actor import make_wallet_actor
+from hedix_wallet.wallet import make_wallet
+
+BATCH_SIZES = (1, 8, 64, 512)
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _run_threads(threads: int, work: Callable[[list[float]], None]) -> tuple[float, list[float]]:
+    latencies: list[list[float]] = [[] for _ in range(threads)]
+    workers = [threading.Thread(target=work, args=(latencies[n],)) for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, [sample for part in latencies for sample in part]
+
+
+def bench_lock(threads: int, count: int, engine: str) -> tuple[float, list[float]]:
+    deposit, withdraw, _, _ = make_wallet(engine=engine)
+    lock = threading.Lock()
+    amount = Decimal("1.25")
+
+    def work(latencies: list[float]) -> None:
+        for i in range(count):
+            start = time.perf_counter()
+            with lock:
+                if i % 2:
+                    withdraw("USD", amount)
+                else:
+                    deposit("USD", amount)
+            latencies.append(time.perf_counter() - start)
+
+    return _run_threads(threads, work)
+
+
+def bench_actor(
+    threads: int, count: int, window: int, engine: str, max_batch: int, max_delay: float
+) -> tuple[float, list[float]]:
+    _, _, snapshot, process = make_wallet(engine=engine)
+    deposit, withdraw, _, close = make_wallet_actor(
+        process, snapshot, max_batch=max_batch, max_delay=max_delay
+    )
+    amount = Decimal("1.25")
+
+    def work(latencies: list[float]) -> None:
+        for base in range(0, count, window):
+            pending: list[tuple[float, Future]] = []
+            for i in range(base, min(base + window, count)):
+                submit = withdraw if i % 2 else deposit
+                pending.append((time.perf_counter(), submit("USD", amount)))
+            for started, future in pending:
+                future.result()
+                latencies.append(time.perf_counter() - started)
+
+    try:
+        return _run_threads(threads, work)
+    finally:
+        close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--count", type=int, default=20_000, help="operations per thread")
+    parser.add_argument("--window", type=int, default=64, help="outstanding requests per thread")
+    parser.add_argument("--engine", default="inplace")
+    parser.add_argument("--max-delay", type=float, default=0.0005)
+    args = parser.parse_args()
+    total = args.threads * args.count
+
+    print(
+        f"{args.threads} threads x {args.count:,} ops, window {args.window}, "
+        f"engine {args.engine}, max_delay {args.max_delay * 1e3:g} ms"
+    )
+    print(f"{'mode':<16} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10}")
+    rows = [("lock (per call)", bench_lock(args.threads, args.count, args.engine))]
+    for max_batch in BATCH_SIZES:
+        result = bench_actor(
+            args.threads, args.count, args.window, args.engine, max_batch, args.max_delay
+        )
+        rows.append((f"actor batch={max_batch}", result))
+    for label, (elapsed, latencies) in rows:
+        print(
+            f"{label:<16} {total / elapsed:>12,.0f}"
+            f" {_percentile(latencies, 0.5) * 1e6:>10,.1f}"
+            f" {_percentile(latencies, 0.99) * 1e6:>10,.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: per-call `deposit`/`withdraw` vs. the bulk `deposit_many`/`withdraw_many`.
+
+Run with `uv run python benchmarks/bench_bulk.py [--count N] [--engine NAME]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from decimal import Decimal
+
+from hedix_wallet.engines import DEFAULT_ENGINE, engine_names
+from hedix_wallet.wallet import make_bulk_wallet
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500_000)
+    parser.add_argument("--engine", choices=engine_names(), default=DEFAULT_ENGINE)
+    args = parser.parse_args()
+    amounts = [Decimal(f"{i % 97 + 1}.{i % 100:02d}") for i in range(args.count)]
+
+    deposit, withdraw, _, _, _, _ = make_bulk_wallet(engine=args.engine)
+    start = time.perf_counter()
+    for amount in amounts:
+        deposit("BTC", amount)
+    per_call_deposit = time.perf_counter() - start
+    start = time.perf_counter()
+    for amount in amounts:
+        withdraw("BTC", amount)
+    per_call_withdraw = time.perf_counter() - start
+
+    _, _, _, _, deposit_many, withdraw_many = make_bulk_wallet(engine=args.engine)
+    start = time.perf_counter()
+    deposit_many("BTC", amounts)
+    bulk_deposit = time.perf_counter() - start
+    start = time.perf_counter()
+    withdraw_many("BTC", amounts)
+    bulk_withdraw = time.perf_counter() - start
+
+    print(f"{args.count:,} same-asset amounts, {args.engine} engine, ops/s")
+    print(f"{'operation':<10} {'per call':>14} {'bulk':>14} {'speedup':>8}")
+    for name, single, bulk in (
+        ("deposit", per_call_deposit, bulk_deposit),
+        ("withdraw", per_call_withdraw, bulk_withdraw),
+    ):
+        print(
+            f"{name:<10} {args.count / single:>14,.0f} {args.count / bulk:>14,.0f}"
+            f" {single / bulk:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
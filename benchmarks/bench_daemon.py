@@ -0,0 +1,108 @@
+"""Latency benchmark: resident daemon vs. a cold `wallet process` run.
+
+Starts `wallet daemon` on a temporary socket, then compares:
+- cold CLI: a fresh interpreter running `wallet process FILE`
+- cold client: a fresh interpreter running `wallet client FILE` against the daemon
+- warm round trip: one request per connection from this process (p50/p99)
+- pipelined: one connection streaming N requests
+
+Run with `uv run python benchmarks/bench_daemon.py [--lines N] [--runs N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from hedix_wallet.adapters.daemon_client import send_request, send_requests
+
+WALLET = [sys.executable, "-m", "hedix_wallet.main"]
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    return env
+
+
+def _write_input(path: str, lines: int) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        for i in range(lines):
+            kind = "WITHDRAW" if i % 3 == 2 else "DEPOSIT"
+            handle.write(f"{kind} {('BTC', 'ETH', 'USD')[i % 3]} {i % 7 + 1}.25\n")
+
+
+def _median_ms(command: list[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, env=_env(), stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _wait_for(socket_path: str) -> None:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            send_request(socket_path, "SNAPSHOT")
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("daemon did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1000, help="lines per input file")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=2000, help="warm round trips")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "wallet.sock")
+        input_path = os.path.join(tmp, "input.txt")
+        _write_input(input_path, args.lines)
+        daemon = subprocess.Popen(
+            [*WALLET, "daemon", "--socket", socket_path], env=_env(), stdout=subprocess.DEVNULL
+        )
+        try:
+            _wait_for(socket_path)
+            cold_cli = _median_ms([*WALLET, "process", input_path], args.runs)
+            cold_client = _median_ms(
+                [*WALLET, "client", "--socket", socket_path, input_path], args.runs
+            )
+
+            latencies = []
+            for _ in range(args.requests):
+                start = time.perf_counter()
+                send_request(socket_path, "DEPOSIT USD 1")
+                latencies.append((time.perf_counter() - start) * 1e6)
+            latencies.sort()
+
+            pipelined = [f"DEPOSIT BTC 0.{i % 9 + 1}" for i in range(args.requests * 50)]
+            start = time.perf_counter()
+            count = sum(1 for _ in send_requests(socket_path, pipelined))
+            pipelined_s = time.perf_counter() - start
+
+            send_request(socket_path, "SHUTDOWN")
+        finally:
+            daemon.wait(timeout=10)
+
+    print(f"input: {args.lines} lines, {args.runs} runs per cold measurement")
+    print(f"cold `wallet process FILE`          median {cold_cli:9.2f} ms")
+    print(f"cold `wallet client FILE` (daemon)  median {cold_client:9.2f} ms")
+    print(
+        f"warm round trip (1 req/connection)  p50 {latencies[len(latencies) // 2]:9.1f} us"
+        f"  p99 {latencies[int(len(latencies) * 0.99)]:9.1f} us"
+    )
+    print(f"pipelined ({count} requests)         {count / pipelined_s:12,.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
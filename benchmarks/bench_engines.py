@@ -0,0 +1,71 @@
+"""Throughput benchmark for the registered wallet engines.
+
+Measures the batch path (`process` over a list and over a generator) and the
+interactive path (`deposit`/`withdraw` calls) for every engine.
+
+Run with `uv run python benchmarks/bench_engines.py [--count N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Iterator
+from decimal import Decimal
+
+from hedix_wallet.engines import engine_names
+from hedix_wallet.wallet import Asset, Transaction, make_wallet
+
+ASSETS: tuple[Asset, ...] = ("BTC", "ETH", "USD")
+
+
+def _transactions(count: int) -> Iterator[Transaction]:
+    amounts = [Decimal(f"{n}.{n:02d}") for n in range(1, 50)]
+    for i in range(count):
+        yield {
+            "type": "WITHDRAW" if i % 4 == 3 else "DEPOSIT",
+            "asset": ASSETS[i % 3],
+            "amount": amounts[i % len(amounts)],
+        }
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>14,.0f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500_000)
+    args = parser.parse_args()
+    batch = list(_transactions(args.count))
+
+    print(f"{args.count:,} transactions, tx/s")
+    print(f"{'engine':<10} {'process(list)':>14} {'process(gen)':>14} {'interactive':>14}")
+    for name in engine_names():
+        _, _, _, process = make_wallet(engine=name)
+        start = time.perf_counter()
+        process(batch)
+        listed = time.perf_counter() - start
+
+        _, _, _, process = make_wallet(engine=name)
+        start = time.perf_counter()
+        process(_transactions(args.count))
+        generated = time.perf_counter() - start
+
+        deposit, withdraw, _, _ = make_wallet(engine=name)
+        start = time.perf_counter()
+        for tx in batch:
+            if tx["type"] == "DEPOSIT":
+                deposit(tx["asset"], tx["amount"])
+            else:
+                withdraw(tx["asset"], tx["amount"])
+        interactive = time.perf_counter() - start
+
+        print(
+            f"{name:<10} {_rate(args.count, listed)} {_rate(args.count, generated)} "
+            f"{_rate(args.count, interactive)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
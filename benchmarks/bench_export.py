@@ -0,0 +1,72 @@
+"""Benchmark: bulk snapshot export vs. repeated `format_balances` + `print`.
+
+Simulates periodic snapshots of `--wallets` wallets over `--periods` periods; between two
+periods `--churn` of the wallets apply a deposit, so most balances repeat unchanged (the
+case the exporter's Decimal conversion cache targets). Output goes to `os.devnull`.
+
+Run with `uv run python benchmarks/bench_export.py [--wallets N] [--periods N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from decimal import Decimal
+
+from hedix_wallet.adapters.export import EXPORT_FORMATS, make_exporter
+from hedix_wallet.wallet import Balances, format_balances, make_wallet
+
+
+def build_snapshots(wallets: int, periods: int, churn: float) -> list[list[Balances]]:
+    rng = random.Random(1)
+    funcs = [
+        make_wallet({"BTC": Decimal("0.5"), "ETH": Decimal(n % 10), "USD": Decimal("1000.00")})
+        for n in range(wallets)
+    ]
+    periods_out = []
+    for _ in range(periods):
+        for deposit, _, _, _ in rng.sample(funcs, int(wallets * churn)):
+            deposit(rng.choice(("BTC", "ETH", "USD")), Decimal(f"{rng.randint(1, 9999)}.25"))
+        periods_out.append([snapshot() for _, _, snapshot, _ in funcs])
+    return periods_out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wallets", type=int, default=20_000)
+    parser.add_argument("--periods", type=int, default=20)
+    parser.add_argument("--churn", type=float, default=0.1)
+    args = parser.parse_args()
+    periods = build_snapshots(args.wallets, args.periods, args.churn)
+    records = args.wallets * args.periods
+
+    rows = []
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        start = time.perf_counter()
+        for snapshots in periods:
+            for balances in snapshots:
+                print(format_balances(balances), file=sink)
+        rows.append(("format_balances+print", time.perf_counter() - start, 0))
+
+    for output_format in EXPORT_FORMATS:
+        for label, cache_size in (("", None), (" (no cache)", 1)):
+            with open(os.devnull, "wb") as sink:
+                options = {} if cache_size is None else {"cache_size": cache_size}
+                start = time.perf_counter()
+                write_batch, flush = make_exporter(sink, output_format, **options)
+                written = sum(write_batch(snapshots) for snapshots in periods)
+                flush()
+                rows.append((output_format + label, time.perf_counter() - start, written))
+
+    print(f"{args.wallets:,} wallets x {args.periods} periods, churn {args.churn:.0%}")
+    print(f"{'path':<22} {'records/s':>12} {'bytes/record':>13} {'speedup':>8}")
+    baseline = rows[0][1]
+    for label, elapsed, written in rows:
+        size = f"{written / records:.1f}" if written else "-"
+        print(f"{label:<22} {records / elapsed:>12,.0f} {size:>13} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Throughput benchmark for the streaming input adapters (text lines, NDJSON, CSV).
+
+For each format the same N transactions are decoded from in-memory lines, both parse-only
+and end-to-end through the facade's batch `process`.
+
+Run with `uv run python benchmarks/bench_ingest.py [--count N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Iterable, Iterator
+
+from hedix_wallet.adapters.cli import iter_transactions
+from hedix_wallet.adapters.csv_format import iter_csv_transactions
+from hedix_wallet.adapters.ndjson import iter_ndjson_transactions
+from hedix_wallet.wallet import Transaction, make_wallet
+
+Decoder = Callable[[Iterable[str]], Iterator[Transaction]]
+
+
+def _records(count: int) -> Iterator[tuple[str, str, str]]:
+    assets = ("BTC", "ETH", "USD")
+    for i in range(count):
+        kind = "WITHDRAW" if i % 3 == 2 else "DEPOSIT"
+        yield kind, assets[i % 3], f"{i % 97 + 1}.{i % 10_000:04d}"
+
+
+def build_inputs(count: int) -> dict[str, tuple[list[str], Decoder]]:
+    records = list(_records(count))
+    return {
+        "text": ([f"{t} {a} {m}\n" for t, a, m in records], iter_transactions),
+        "ndjson": (
+            [f'{{"type": "{t}", "asset": "{a}", "amount": {m}}}\n' for t, a, m in records],
+            iter_ndjson_transactions,
+        ),
+        "csv": (
+            ["type,asset,amount\n", *(f"{t},{a},{m}\n" for t, a, m in records)],
+            iter_csv_transactions,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{args.count:,} transactions")
+    print(f"{'format':<8} {'parse only (tx/s)':>20} {'parse + process (tx/s)':>24}")
+    baseline = None
+    for name, (lines, decode) in build_inputs(args.count).items():
+        start = time.perf_counter()
+        for _ in decode(lines):
+            pass
+        parse_rate = args.count / (time.perf_counter() - start)
+
+        _, _, _, process = make_wallet()
+        start = time.perf_counter()
+        process(decode(lines))
+        total_rate = args.count / (time.perf_counter() - start)
+
+        baseline = baseline or parse_rate
+        print(
+            f"{name:<8} {parse_rate:>20,.0f} {total_rate:>24,.0f}"
+            f"   ({parse_rate / baseline:.2f}x text parse)"
+        )
+
+
+if __name__ == "__main__":
+    main()
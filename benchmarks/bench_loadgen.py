@@ -0,0 +1,42 @@
+"""Benchmark: synthetic workload generation throughput per output format.
+
+Generated byte chunks are written to `os.devnull` (or `--output`), so the figures include
+the binary file write path used by `wallet loadgen -o FILE`. The timing includes sampling
+the initial template pool.
+
+Run with `uv run python benchmarks/bench_loadgen.py [--count N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from hedix_wallet.adapters.loadgen import OUTPUT_FORMATS, make_load_generator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10_000_000)
+    parser.add_argument("--output", default=os.devnull)
+    args = parser.parse_args()
+
+    print(f"{args.count:,} transactions per format")
+    print(f"{'format':<8} {'rows/s':>12} {'MB/s':>8} {'s per GB':>9}")
+    for output_format in OUTPUT_FORMATS:
+        start = time.perf_counter()
+        generate, _ = make_load_generator(seed=1, output_format=output_format)
+        written = 0
+        with open(args.output, "wb") as handle:
+            for chunk in generate(args.count):
+                written += handle.write(chunk)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{output_format:<8} {args.count / elapsed:>12,.0f} {written / elapsed / 1e6:>8.1f}"
+            f" {elapsed / written * 1e9:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
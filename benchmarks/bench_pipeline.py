@@ -0,0 +1,55 @@
+"""Ingest throughput: serial parsing vs. the parallel parse / in-order apply pipeline.
+
+Run with `uv run python benchmarks/bench_pipeline.py [--count N] [--workers 1 2 4 8]`.
+Speedups depend on the available cores; the in-order apply stage (and rebuilding parsed
+`Decimal`s in the parent, which pickling requires) stays serial.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from hedix_wallet.adapters.cli import iter_transactions
+from hedix_wallet.adapters.pipeline import DEFAULT_CHUNK_LINES, iter_parallel_transactions
+from hedix_wallet.wallet import make_wallet
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    parser.add_argument("--engine", default="inplace")
+    args = parser.parse_args()
+
+    assets = ("BTC", "ETH", "USD")
+    lines = [
+        f"{'WITHDRAW' if i % 4 == 3 else 'DEPOSIT'} {assets[i % 3]} {i % 997 + 1}.{i % 100:02d}\n"
+        for i in range(args.count)
+    ]
+
+    _, _, _, process = make_wallet(engine=args.engine)
+    start = time.perf_counter()
+    expected = process(iter_transactions(lines))
+    serial = time.perf_counter() - start
+    print(f"{args.count:,} lines, {os.cpu_count()} CPUs, engine {args.engine}")
+    print(f"{'serial':<12} {args.count / serial:>12,.0f} tx/s")
+
+    for workers in sorted(set(args.workers)):
+        _, _, _, process = make_wallet(engine=args.engine)
+        start = time.perf_counter()
+        result = process(
+            iter_parallel_transactions(lines, workers=workers, chunk_lines=args.chunk_lines)
+        )
+        elapsed = time.perf_counter() - start
+        assert result == expected, "parallel pipeline diverged from serial processing"
+        print(
+            f"{f'{workers} workers':<12} {args.count / elapsed:>12,.0f} tx/s"
+            f"  ({serial / elapsed:.2f}x serial)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Startup benchmark: cold interpreter wall time and an `-X importtime` breakdown.
+
+Run with `uv run python benchmarks/bench_startup.py [--runs N] [--top N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS: dict[str, str] = {
+    "python (baseline)": "pass",
+    "import hedix_wallet": "import hedix_wallet",
+    "import hedix_wallet.main": "import hedix_wallet.main",
+    "make_wallet()": "from hedix_wallet import make_wallet; make_wallet()",
+    "wallet (example run)": "from hedix_wallet.main import main; main()",
+}
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    return env
+
+
+def wall_time_ms(code: str, runs: int) -> float:
+    """Median wall time (ms) of a fresh interpreter executing `code`."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, env=_env(), stdout=subprocess.DEVNULL
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def import_breakdown(code: str) -> list[tuple[str, int, int]]:
+    """Return `(module, self_us, cumulative_us)` rows reported by `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<26} {'median wall (ms)':>18}")
+    for label, code in SCENARIOS.items():
+        print(f"{label:<26} {wall_time_ms(code, args.runs):>18.2f}")
+
+    for label, code in list(SCENARIOS.items())[1:]:
+        rows = import_breakdown(code)
+        total = sum(self_us for _, self_us, _ in rows)
+        print()
+        print(f"{label}: {len(rows)} modules, {total / 1000:.2f} ms total import time")
+        for name, self_us, cumulative_us in sorted(rows, key=lambda r: -r[1])[: args.top]:
+            print(f"  {name:<40} self {self_us:>7} us  cumulative {cumulative_us:>7} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,22 @@
-"""Hedix Wallet - Minimal functional crypto wallet."""
+"""Hedix Wallet - Minimal functional crypto wallet.
+
+The public names are loaded lazily on first attribute access, so `import hedix_wallet`
+stays cheap for short-lived CLI invocations that never touch the facade.
+"""
 
 __version__ = "0.1.0"
 
-from .wallet import (
-    Asset,
-    Transaction,
-    TransactionType,
-    format_balances,
-    make_wallet,
-    parse_transaction,
-)
+# Equivalent to `typing.TYPE_CHECKING`, without paying for the `typing` import at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .wallet import (
+        Asset,
+        Transaction,
+        TransactionType,
+        format_balances,
+        make_wallet,
+        parse_transaction,
+    )
 
 __all__ = [
     "Asset",
@@ -20,3 +27,17 @@ __all__ = [
     "parse_transaction",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        from . import wallet
+
+        value = getattr(wallet, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
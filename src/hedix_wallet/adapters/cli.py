@@ -2,18 +2,68 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from decimal import Decimal
 from typing import cast
 
-from hedix_wallet.domain.types import Asset, PositiveDecimal, Transaction, TransactionType
+from hedix_wallet.domain.types import (
+    Asset,
+    Balances,
+    PositiveDecimal,
+    Transaction,
+    TransactionType,
+)
+
+# Equivalent to `typing.TYPE_CHECKING`; keeps the stats and digest modules (and `hashlib`)
+# off the parse/format import path
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from hedix_wallet.domain.digest import WalletDigest
+    from hedix_wallet.domain.stats import AssetStats
 
 
 def parse_asset(value: str) -> Asset:
     upper = value.strip().upper()
     if upper not in ("BTC", "ETH", "USD"):
         raise ValueError(f"Invalid asset: '{value}'. Supported: BTC, ETH, USD")
-    return upper
+    return cast(Asset, upper)
+
+
+def parse_transaction_type(value: str) -> TransactionType:
+    upper = value.strip().upper()
+    if upper not in ("DEPOSIT", "WITHDRAW"):
+        raise ValueError("Invalid transaction type. Expected: DEPOSIT or WITHDRAW")
+    return cast(TransactionType, upper)
+
+
+def parse_amount(value: str | Decimal) -> PositiveDecimal:
+    """Parse an exact, finite, strictly positive amount from text or an existing Decimal."""
+    if isinstance(value, Decimal):
+        amount = value
+    elif isinstance(value, str):
+        try:
+            amount = Decimal(value.strip())
+        except (ValueError, ArithmeticError):
+            raise ValueError(f"Invalid amount: '{value}'. Must be a valid number.")
+    else:
+        raise ValueError(f"Invalid amount: '{value}'. Must be a valid number.")
+
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: '{value}'. Must be a valid number.")
+    if amount <= 0:
+        raise ValueError("Transaction amount must be positive")
+    return cast(PositiveDecimal, amount)
+
+
+def build_transaction(
+    type_value: str, asset_value: str, amount_value: str | Decimal
+) -> Transaction:
+    """Validate raw field values (from any input format) into a `Transaction`."""
+    return {
+        "type": parse_transaction_type(type_value),
+        "asset": parse_asset(asset_value),
+        "amount": parse_amount(amount_value),
+    }
 
 
 def parse_transaction(line: str) -> Transaction:
@@ -22,25 +72,60 @@ def parse_transaction(line: str) -> Transaction:
         raise ValueError("Invalid transaction format. Expected: 'TYPE ASSET AMOUNT'")
 
     type_str, asset_str, amount_str = parts
-    type_upper: TransactionType = type_str.upper()
+    return build_transaction(type_str, asset_str, amount_str)
 
-    if type_upper not in ("DEPOSIT", "WITHDRAW"):
-        raise ValueError("Invalid transaction type. Expected: DEPOSIT or WITHDRAW")
 
-    asset = parse_asset(asset_str)
-    try:
-        amount = Decimal(amount_str)
-    except (ValueError, ArithmeticError):
-        raise ValueError(f"Invalid amount: '{amount_str}'. Must be a valid number.")
+def format_balances(balances: Balances | Mapping[Asset, Decimal]) -> str:
+    ordered_assets: list[Asset] = ["BTC", "ETH", "USD"]
+    parts = [f"{asset}: {balances.get(asset, Decimal('0'))}" for asset in ordered_assets]
+    return ", ".join(parts)
 
-    if amount <= 0:
-        raise ValueError("Transaction amount must be positive")
 
-    positive_amount = cast(PositiveDecimal, amount)
-    return {"type": type_upper, "asset": asset, "amount": positive_amount}
+def format_digest(digest: WalletDigest) -> str:
+    """Render a state digest (see `domain.digest.make_digest`) on one comparable line."""
+    stream, balances = digest["stream"].hex(), digest["balances"].hex()
+    return f"offset {digest['offset']} stream {stream} balances {balances}"
+
 
+def _format_quantiles(quantiles: Mapping[float, float | None]) -> str:
+    labels = "/".join(f"p{q * 100:g}" for q in quantiles)
+    values = " / ".join("-" if v is None else f"~{v:.4g}" for v in quantiles.values())
+    return f"{labels}: {values}"
 
-def format_balances(balances: Mapping[Asset, Decimal]) -> str:
+
+def format_stats(stats: Mapping[Asset, AssetStats]) -> str:
+    """Render per-asset statistics (see `domain.stats.make_stats`) as a multi-line report."""
     ordered_assets: list[Asset] = ["BTC", "ETH", "USD"]
-    parts = [f"{asset}: {balances.get(asset, Decimal('0'))}" for asset in ordered_assets]
-    return ", ".join(parts)
+    lines = []
+    for asset in ordered_assets:
+        entry = stats.get(asset)
+        if entry is None:
+            continue
+        lines.append(
+            f"{asset}: deposits {entry['deposit_count']} (volume {entry['deposit_volume']}), "
+            f"withdrawals {entry['withdraw_count']} (volume {entry['withdraw_volume']}), "
+            f"failed withdrawals {entry['failed_withdraw_count']} "
+            f"(volume {entry['failed_withdraw_volume']})"
+        )
+        lines.append(
+            f"  balance {entry['balance']} "
+            f"(min {entry['min_balance']}, max {entry['max_balance']})"
+        )
+        lines.append(f"  deposit size {_format_quantiles(entry['deposit_quantiles'])}")
+        lines.append(f"  withdraw size {_format_quantiles(entry['withdraw_quantiles'])}")
+    return "\n".join(lines)
+
+
+def iter_transactions(lines: Iterable[str]) -> Iterator[Transaction]:
+    """Lazily parse `TYPE ASSET AMOUNT` lines, skipping blank lines and `#` comments.
+
+    Parse errors are re-raised as `ValueError` prefixed with the 1-based line number.
+    """
+    for lineno, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            yield parse_transaction(stripped)
+        except ValueError as exc:
+            raise ValueError(f"line {lineno}: {exc}") from exc
@@ -0,0 +1,60 @@
+"""CSV input adapter - streams transactions from `type,asset,amount` rows.
+
+The first row is a header naming the columns (any order, case-insensitive, extra
+columns ignored) unless explicit `fieldnames` are given. Amount cells are parsed
+directly into `Decimal`, so values are exact.
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Iterator, Sequence
+
+from hedix_wallet.adapters.cli import build_transaction
+from hedix_wallet.domain.types import Transaction
+
+REQUIRED_COLUMNS = ("type", "asset", "amount")
+
+
+def _column_positions(fieldnames: Sequence[str]) -> tuple[int, int, int]:
+    normalized = [name.strip().lower() for name in fieldnames]
+    missing = [column for column in REQUIRED_COLUMNS if column not in normalized]
+    if missing:
+        raise ValueError(f"CSV header must contain columns {', '.join(REQUIRED_COLUMNS)}")
+    type_at, asset_at, amount_at = (normalized.index(column) for column in REQUIRED_COLUMNS)
+    return type_at, asset_at, amount_at
+
+
+def iter_csv_transactions(
+    lines: Iterable[str], fieldnames: Sequence[str] | None = None
+) -> Iterator[Transaction]:
+    """Lazily decode CSV rows into transactions (empty rows are skipped).
+
+    Args:
+        lines: CSV text lines, e.g. an open file or `sys.stdin`.
+        fieldnames: Column names when the input has no header row.
+
+    Errors are re-raised as `ValueError` prefixed with the 1-based line number.
+    """
+    rows = csv.reader(lines)
+    if fieldnames is not None:
+        type_at, asset_at, amount_at = _column_positions(fieldnames)
+    else:
+        header = next(rows, None)
+        if header is None:
+            return
+        try:
+            type_at, asset_at, amount_at = _column_positions(header)
+        except ValueError as exc:
+            raise ValueError(f"line {rows.line_num}: {exc}") from exc
+    width = max(type_at, asset_at, amount_at) + 1
+
+    for row in rows:
+        if not row or (len(row) == 1 and not row[0].strip()):
+            continue
+        try:
+            if len(row) < width:
+                raise ValueError(f"Invalid row: expected at least {width} columns")
+            yield build_transaction(row[type_at], row[asset_at], row[amount_at])
+        except ValueError as exc:
+            raise ValueError(f"line {rows.line_num}: {exc}") from exc
@@ -0,0 +1,211 @@
+"""Resident wallet daemon serving the line protocol over a Unix domain socket.
+
+One wallet (built with the facade's `make_wallet`) lives for the whole process and is
+only touched from the single-threaded event loop in `serve`, so no locking is needed.
+Each readable chunk is split into complete lines that are applied in order, and their
+responses are written back with a single send (batching). Clients may pipeline freely:
+when a client stops reading, the daemon stops reading from it until its pending
+responses drain (backpressure) instead of buffering without bound.
+"""
+
+from __future__ import annotations
+
+import os
+import selectors
+import socket
+import threading
+from collections.abc import Callable, Mapping
+from decimal import Decimal
+from typing import TypedDict
+
+from hedix_wallet.adapters.cli import format_balances, parse_transaction
+from hedix_wallet.adapters.daemon_client import (
+    RESPONSE_BALANCES,
+    RESPONSE_ERROR,
+    RESPONSE_FAILED,
+    RESPONSE_OK,
+)
+from hedix_wallet.domain.types import Asset, Balances
+from hedix_wallet.domain.wallet_core import DepositFunc, SnapshotFunc, WithdrawFunc
+
+RECV_BYTES = 256 * 1024
+# Stop reading from a client while this many response bytes are still unsent
+MAX_PENDING_OUTPUT = 1024 * 1024
+# Longest accepted request line; longer input is answered with an error and dropped
+MAX_LINE_BYTES = 4096
+POLL_INTERVAL_SECONDS = 0.2
+# How long shutdown waits for each client to accept its remaining responses
+FLUSH_TIMEOUT_SECONDS = 5.0
+
+RequestHandler = Callable[[str], str]
+
+
+class _Connection(TypedDict):
+    inbuf: bytearray
+    outbuf: bytearray
+    eof: bool
+
+
+def make_request_handler(
+    deposit: DepositFunc, withdraw: WithdrawFunc, snapshot: SnapshotFunc
+) -> RequestHandler:
+    """Build the `request line -> response line` function over a wallet's closures."""
+
+    def handle(request: str) -> str:
+        if request.upper() == "SNAPSHOT":
+            return f"{RESPONSE_BALANCES} {format_balances(snapshot())}"
+        try:
+            tx = parse_transaction(request)
+        except ValueError as exc:
+            return f"{RESPONSE_ERROR} {exc}"
+        try:
+            if tx["type"] == "DEPOSIT":
+                deposit(tx["asset"], tx["amount"])
+                return RESPONSE_OK
+            return RESPONSE_OK if withdraw(tx["asset"], tx["amount"]) else RESPONSE_FAILED
+        except ArithmeticError as exc:  # e.g. decimal.Overflow; the balance is left unchanged
+            return f"{RESPONSE_ERROR} Amount out of range ({type(exc).__name__})"
+
+    return handle
+
+
+def bind_socket(socket_path: str) -> socket.socket:
+    """Create the listening socket, replacing a stale socket file left by a dead daemon."""
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(socket_path)
+        else:
+            raise OSError(f"A wallet daemon is already listening on {socket_path}")
+        finally:
+            probe.close()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    listener.listen()
+    return listener
+
+
+def serve(
+    listener: socket.socket,
+    initial_balances: Mapping[Asset, Decimal] | None = None,
+    *,
+    stop: threading.Event | None = None,
+) -> Balances:
+    """Serve wallet requests on `listener` until `SHUTDOWN` (or `stop` is set).
+
+    On exit every connection is sent its pending responses (requests already applied are
+    always answered) and closed, then the listener is closed and its socket file unlinked.
+
+    Returns:
+        The final balances of the resident wallet.
+    """
+    from hedix_wallet.wallet import make_wallet
+
+    deposit, withdraw, snapshot, _ = make_wallet(initial_balances)
+    handle = make_request_handler(deposit, withdraw, snapshot)
+    selector = selectors.DefaultSelector()
+    listener.setblocking(False)
+    selector.register(listener, selectors.EVENT_READ)
+    socket_path = listener.getsockname()
+    running = True
+
+    def close(sock: socket.socket) -> None:
+        selector.unregister(sock)
+        sock.close()
+
+    def update_interest(sock: socket.socket, conn: _Connection) -> None:
+        events = 0
+        if not conn["eof"] and len(conn["outbuf"]) < MAX_PENDING_OUTPUT:
+            events |= selectors.EVENT_READ
+        if conn["outbuf"]:
+            events |= selectors.EVENT_WRITE
+        if events:
+            selector.modify(sock, events, conn)
+        else:
+            close(sock)  # peer finished sending and every response was flushed
+
+    def handle_lines(conn: _Connection, final: bool) -> None:
+        nonlocal running
+        inbuf = conn["inbuf"]
+        end = len(inbuf) if final else inbuf.rfind(b"\n") + 1
+        if end == 0:
+            if len(inbuf) > MAX_LINE_BYTES:
+                conn["outbuf"] += f"{RESPONSE_ERROR} Request line too long\n".encode()
+                conn["eof"] = True
+                inbuf.clear()
+            return
+        responses = []
+        for raw in bytes(inbuf[:end]).splitlines():
+            request = raw.decode("utf-8", errors="replace").strip()
+            if not request:
+                continue
+            if request.upper() == "SHUTDOWN":
+                responses.append(RESPONSE_OK)
+                running = False
+                break
+            responses.append(handle(request))
+        del inbuf[:end]
+        if responses:
+            conn["outbuf"] += ("\n".join(responses) + "\n").encode()
+
+    try:
+        while running and not (stop is not None and stop.is_set()):
+            for key, events in selector.select(timeout=POLL_INTERVAL_SECONDS):
+                sock = key.fileobj
+                assert isinstance(sock, socket.socket)
+                if sock is listener:
+                    client, _ = listener.accept()
+                    client.setblocking(False)
+                    conn: _Connection = {"inbuf": bytearray(), "outbuf": bytearray(), "eof": False}
+                    selector.register(client, selectors.EVENT_READ, conn)
+                    continue
+
+                conn = key.data
+                try:
+                    if events & selectors.EVENT_READ:
+                        data = sock.recv(RECV_BYTES)
+                        if data:
+                            conn["inbuf"] += data
+                        else:
+                            conn["eof"] = True
+                        handle_lines(conn, final=conn["eof"])
+                    if conn["outbuf"]:
+                        sent = sock.send(conn["outbuf"])
+                        del conn["outbuf"][:sent]
+                except (BlockingIOError, InterruptedError):
+                    pass
+                except OSError:
+                    close(sock)  # client went away
+                    continue
+                update_interest(sock, conn)
+                if not running:
+                    _flush_blocking(sock, conn["outbuf"])
+                    break
+    finally:
+        for key in list(selector.get_map().values()):
+            sock = key.fileobj
+            assert isinstance(sock, socket.socket)
+            if sock is not listener:
+                _flush_blocking(sock, key.data["outbuf"])
+                close(sock)
+        selector.close()
+        listener.close()
+        if isinstance(socket_path, str) and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+    return snapshot()
+
+
+def _flush_blocking(sock: socket.socket, outbuf: bytearray) -> None:
+    if sock.fileno() < 0 or not outbuf:
+        return
+    try:
+        sock.settimeout(FLUSH_TIMEOUT_SECONDS)
+        sock.sendall(outbuf)
+        outbuf.clear()
+    except OSError:
+        pass
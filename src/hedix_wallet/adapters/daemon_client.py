@@ -0,0 +1,111 @@
+"""Client side of the wallet daemon protocol (Unix domain socket, line oriented).
+
+Protocol: every request is one `\\n`-terminated line and gets exactly one response line,
+in order, so clients may pipeline any number of requests before reading responses.
+
+Requests:
+    DEPOSIT|WITHDRAW ASSET AMOUNT   -> OK | FAILED | ERROR <message>
+    SNAPSHOT                        -> BALANCES <BTC: x, ETH: y, USD: z>
+    SHUTDOWN                        -> OK (the daemon stops after replying)
+
+This module only depends on the standard library so the `wallet client` command starts
+without loading the domain.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+
+# Equivalent to `typing.TYPE_CHECKING`, without paying for the `typing` import at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+SOCKET_ENV_VAR = "HEDIX_WALLET_SOCKET"
+
+RESPONSE_OK = "OK"
+RESPONSE_FAILED = "FAILED"
+RESPONSE_ERROR = "ERROR"
+RESPONSE_BALANCES = "BALANCES"
+
+# Requests are coalesced into writes of roughly this many bytes
+SEND_BATCH_BYTES = 64 * 1024
+
+
+def default_socket_path() -> str:
+    """Socket path from `$HEDIX_WALLET_SOCKET`, else a per-user path in the runtime dir."""
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(runtime_dir, f"hedix-wallet-{os.getuid()}.sock")
+
+
+def request_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Normalize input lines into requests, dropping blank lines and `#` comments."""
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            yield stripped
+
+
+def send_requests(socket_path: str, requests: Iterable[str]) -> Iterator[str]:
+    """Pipeline `requests` to the daemon and yield one response line per request, in order.
+
+    Requests are written from a background thread in batches of ~`SEND_BATCH_BYTES` while
+    responses are read concurrently, so arbitrarily long streams never deadlock on full
+    socket buffers.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path)
+    errors: list[BaseException] = []
+
+    def write_all() -> None:
+        try:
+            batch: list[str] = []
+            size = 0
+            for request in requests:
+                batch.append(request)
+                size += len(request) + 1
+                if size >= SEND_BATCH_BYTES:
+                    sock.sendall(("\n".join(batch) + "\n").encode())
+                    batch, size = [], 0
+            if batch:
+                sock.sendall(("\n".join(batch) + "\n").encode())
+        except BaseException as exc:  # re-raised by the reading side
+            errors.append(exc)
+        finally:
+            # Half-close so the daemon answers what it got and then ends the stream
+            _shutdown(sock, socket.SHUT_WR)
+
+    writer = threading.Thread(target=write_all, name="wallet-client-writer", daemon=True)
+    writer.start()
+    try:
+        with sock.makefile("r", encoding="utf-8", newline="\n") as responses:
+            for response in responses:
+                yield response.rstrip("\n")
+    finally:
+        # Unblocks the writer if the caller stopped consuming responses early
+        _shutdown(sock, socket.SHUT_RDWR)
+        writer.join()
+        sock.close()
+    if errors:
+        raise errors[0]
+
+
+def _shutdown(sock: socket.socket, how: int) -> None:
+    try:
+        sock.shutdown(how)
+    except OSError:
+        pass  # already disconnected
+
+
+def send_request(socket_path: str, request: str) -> str:
+    """Send a single request and return its response line."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(request.strip().encode() + b"\n")
+        with sock.makefile("r", encoding="utf-8", newline="\n") as responses:
+            return responses.readline().rstrip("\n")
@@ -0,0 +1,216 @@
+"""Streaming bulk export of `Balances` snapshots as NDJSON, CSV or a compact binary layout.
+
+`make_exporter(stream, output_format)` returns a `write_batch(balances, ids=None)` function
+that encodes whole batches of snapshots (e.g. periodic snapshots of many wallets) into an
+internal buffer, handing it to the binary `stream` in writes of at least `buffer_size`
+bytes, plus a `flush()` that writes whatever is left.
+
+Decimal conversion is cached per exporter. The cache is keyed by object identity, because
+numerically equal `Decimal`s can render differently (`1.5` vs `1.50`); balances that did not
+change between two snapshots are the very same objects, so repeated values are converted
+once. Entries keep their `Decimal` alive, so an `id` can never be reused while cached.
+
+Formats (one record per snapshot, amounts exact):
+- `ndjson`: `{"id":"w1","BTC":1.5,"ETH":0,"USD":700}` (JSON numbers, `id` only with ids)
+- `csv`: header `id,BTC,ETH,USD` (or `BTC,ETH,USD`), then one row per snapshot
+- `binary`: `BINARY_MAGIC`, a flags byte (bit 0: records carry ids), then per record an
+  optional id (varint length + UTF-8) and BTC/ETH/USD each as two varints: the zigzagged
+  exponent and `coefficient << 1 | sign`. `iter_binary_balances` decodes it.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from decimal import Decimal
+from typing import BinaryIO
+
+from hedix_wallet.domain.types import Asset, Balances
+
+EXPORT_FORMATS = ("ndjson", "csv", "binary")
+DEFAULT_BUFFER_BYTES = 1024 * 1024
+# Size it above 3x the number of wallets exported per period for repeats to hit
+DEFAULT_CACHE_ENTRIES = 262_144
+BINARY_MAGIC = b"HXWB\x01"
+
+WriteBatchFunc = Callable[..., int]
+FlushFunc = Callable[[], None]
+_Encoder = Callable[[Decimal], bytes]
+
+_ASSETS: tuple[Asset, ...] = ("BTC", "ETH", "USD")
+_CSV_SPECIALS = frozenset(',"\r\n')
+
+
+_SMALL_VARINTS = [bytes((value,)) for value in range(0x80)]
+
+
+def _varint(value: int) -> bytes:
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _text_bytes(value: Decimal) -> bytes:
+    return str(value).encode()
+
+
+def _binary_bytes(value: Decimal) -> bytes:
+    # Parsing `str` (exact for finite Decimals) is several times cheaper than `as_tuple`
+    mantissa, _, exponent_text = str(value).partition("E")
+    if not value.is_finite():
+        raise ValueError(f"Cannot export non-finite amount: {value}")
+    sign = mantissa.startswith("-")
+    whole, _, fraction = mantissa.lstrip("-").partition(".")
+    coefficient = int(whole + fraction)
+    exponent = int(exponent_text or 0) - len(fraction)
+    zigzag = exponent << 1 if exponent >= 0 else (-exponent << 1) - 1
+    return _varint(zigzag) + _varint(coefficient << 1 | sign)
+
+
+def _make_cached(convert: _Encoder, max_entries: int) -> _Encoder:
+    cache: dict[int, tuple[Decimal, bytes]] = {}
+
+    def cached(value: Decimal) -> bytes:
+        entry = cache.get(id(value))
+        if entry is not None and entry[0] is value:
+            return entry[1]
+        encoded = convert(value)
+        if len(cache) >= max_entries:
+            cache.clear()
+        cache[id(value)] = (value, encoded)
+        return encoded
+
+    return cached
+
+
+def _csv_field(text: str) -> str:
+    if _CSV_SPECIALS.isdisjoint(text):
+        return text
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _id_bytes(output_format: str, record_id: str) -> bytes:
+    if output_format == "ndjson":
+        return json.dumps(record_id).encode()
+    if output_format == "csv":
+        return _csv_field(record_id).encode()
+    encoded = record_id.encode()
+    return _varint(len(encoded)) + encoded
+
+
+def make_exporter(
+    stream: BinaryIO,
+    output_format: str = "ndjson",
+    *,
+    with_ids: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_BYTES,
+    cache_size: int = DEFAULT_CACHE_ENTRIES,
+) -> tuple[WriteBatchFunc, FlushFunc]:
+    """Create a buffered snapshot exporter using a closure to encapsulate state.
+
+    Args:
+        stream: Binary destination (e.g. `open(path, "wb")` or `sys.stdout.buffer`).
+        output_format: `ndjson`, `csv` or `binary`.
+        with_ids: Records carry a wallet id (pass `ids` to every `write_batch`).
+        buffer_size: Bytes accumulated before they are written to `stream`.
+        cache_size: Maximum cached Decimal conversions (the cache is cleared when full).
+
+    Returns:
+        (write_batch, flush):
+            - write_batch(balances, ids=None): encode a batch of snapshots, return its size
+            - flush(): write buffered output and flush `stream` (call it when done)
+
+    The CSV header / binary preamble is written first, even when no batch is.
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: '{output_format}'")
+    if buffer_size < 1 or cache_size < 1:
+        raise ValueError("buffer_size and cache_size must be positive")
+
+    convert = _binary_bytes if output_format == "binary" else _text_bytes
+    encode = _make_cached(convert, cache_size)
+    if output_format == "ndjson":
+        template = b'{"id":%s,' if with_ids else b"{"
+        template += b'"BTC":%s,"ETH":%s,"USD":%s}\n'
+        preamble = b""
+    elif output_format == "csv":
+        template = b"%s,%s,%s,%s\n" if with_ids else b"%s,%s,%s\n"
+        preamble = b"id,BTC,ETH,USD\n" if with_ids else b"BTC,ETH,USD\n"
+    else:
+        template = b"%s%s%s%s" if with_ids else b"%s%s%s"
+        preamble = BINARY_MAGIC + (b"\x01" if with_ids else b"\x00")
+    pending = bytearray(preamble)
+
+    def write_batch(batch: Iterable[Balances], ids: Iterable[str] | None = None) -> int:
+        if (ids is None) == with_ids:
+            raise ValueError("ids must be given exactly when the exporter was made with_ids")
+        if ids is None:
+            records = [
+                template % (encode(b["BTC"]), encode(b["ETH"]), encode(b["USD"])) for b in batch
+            ]
+        else:
+            records = [
+                template
+                % (
+                    _id_bytes(output_format, record_id),
+                    encode(b["BTC"]),
+                    encode(b["ETH"]),
+                    encode(b["USD"]),
+                )
+                for record_id, b in zip(ids, batch, strict=True)
+            ]
+        encoded = b"".join(records)
+        pending.extend(encoded)
+        if len(pending) >= buffer_size:
+            stream.write(pending)
+            pending.clear()
+        return len(encoded)
+
+    def flush() -> None:
+        if pending:
+            stream.write(pending)
+            pending.clear()
+        stream.flush()
+
+    return write_batch, flush
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def iter_binary_balances(data: bytes) -> Iterator[tuple[str | None, Balances]]:
+    """Decode the `binary` export layout into `(id or None, Balances)` pairs."""
+    if not data.startswith(BINARY_MAGIC) or len(data) <= len(BINARY_MAGIC):
+        raise ValueError("Not a binary balances export")
+    with_ids = bool(data[len(BINARY_MAGIC)] & 1)
+    position = len(BINARY_MAGIC) + 1
+    try:
+        while position < len(data):
+            record_id = None
+            if with_ids:
+                length, position = _read_varint(data, position)
+                record_id = data[position : position + length].decode()
+                position += length
+            values = []
+            for _ in _ASSETS:
+                zigzag, position = _read_varint(data, position)
+                packed, position = _read_varint(data, position)
+                exponent = zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+                digits = tuple(int(d) for d in str(packed >> 1))
+                values.append(Decimal((packed & 1, digits, exponent)))
+            yield record_id, {"BTC": values[0], "ETH": values[1], "USD": values[2]}
+    except IndexError:
+        raise ValueError("Truncated binary balances export") from None
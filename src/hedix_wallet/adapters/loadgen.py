@@ -0,0 +1,432 @@
+"""Deterministic synthetic workload generator for load testing.
+
+`make_load_generator(profile, seed, output_format)` returns a `generate(count)` function
+that streams `count` transactions as ready-to-write byte chunks in one of the supported
+input formats (`text`, `ndjson`, `csv`). The same profile, seed and format always produce
+byte-identical output, and every format decodes to the same transactions.
+
+Amounts are integer minor units (`places` decimal digits per asset) rendered with exactly
+that many decimals, so they parse back into exact `Decimal`s. Rows are emitted in blocks of
+`BLOCK_ROWS` lines. Each block is an encoded template drawn from a rolling pool of
+`TEMPLATE_POOL_SIZE` sampled blocks, one of which is resampled every
+`TEMPLATE_REFRESH_BLOCKS` blocks. The template is filled with a single `bytes %` call that
+redraws up to `JITTER_DIGITS` trailing digits of every amount. Reused blocks therefore never
+repeat verbatim, and the hot path does no per-line formatting or encoding.
+
+The generator bounds the balances the wallet will hold while replaying the stream, which
+lets it choose every withdrawal's outcome:
+- an intended failure asks for more than the upper bound;
+- an intended success asks for at most the lower bound.
+Withdrawals that depend on balances carried in from earlier blocks are left as holes in the
+template and resolved when the block is filled. A success is impossible on an empty
+balance. Such forced failures are credited against later intended failures, so the realised
+failed-withdrawal rate follows `fail_rate` whenever the balances allow it.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import re
+from bisect import bisect
+from collections.abc import Callable, Iterator
+from decimal import Decimal, InvalidOperation
+from itertools import accumulate
+from typing import Literal, TypeAlias, TypedDict
+
+from hedix_wallet.adapters.cli import parse_asset
+from hedix_wallet.domain.types import Asset
+
+OUTPUT_FORMATS = ("text", "ndjson", "csv")
+DEFAULT_CHUNK_ROWS = 16_384
+# Rows are emitted in blocks filled from a rolling pool of sampled block templates
+BLOCK_ROWS = 4096
+TEMPLATE_POOL_SIZE = 16
+TEMPLATE_REFRESH_BLOCKS = 256
+# Trailing amount digits redrawn each time a template row is emitted
+JITTER_DIGITS = 3
+
+DistributionKind: TypeAlias = Literal["fixed", "uniform", "lognormal"]
+
+
+class AmountDistribution(TypedDict):
+    kind: DistributionKind
+    # fixed: (value,); uniform: (low, high); lognormal: (median, sigma)
+    params: tuple[Decimal, ...]
+
+
+class LoadProfile(TypedDict):
+    asset_weights: dict[Asset, float]
+    withdraw_ratio: float
+    fail_rate: float
+    amounts: dict[Asset, AmountDistribution]
+    places: dict[Asset, int]
+
+
+class LoadSummary(TypedDict):
+    transactions: int
+    deposits: int
+    withdrawals: int
+    failed_withdrawals: int
+
+
+GenerateFunc = Callable[..., Iterator[bytes]]
+SummaryFunc = Callable[[], LoadSummary]
+_Sampler = Callable[[], int]
+_Renderer = Callable[[int], bytes]
+# (is withdrawal, balance slot, sampler, jitter thresholds, lowest amount, highest amount,
+#  line prefix, line suffix, renderer)
+_Event = tuple[bool, int, _Sampler, list[int], int, float, bytes, bytes, _Renderer]
+# (row, argument index, intended failure, slot, lower prefix, upper prefix, amount, renderer)
+_Hole = tuple[int, int, bool, int, int, int, int, _Renderer]
+# (encoded block with % placeholders, row kinds, placeholder count, holes,
+#  lower balance delta per slot, upper balance delta per slot)
+_Template = tuple[bytes, bytes, int, list[_Hole], list[int], list[int]]
+
+_DISTRIBUTION_ARITY: dict[str, int] = {"fixed": 1, "uniform": 2, "lognormal": 2}
+_JITTER_PLACEHOLDERS = [b"%%.%ds" % k for k in range(JITTER_DIGITS + 1)]
+_HOLE_PLACEHOLDER = b"%s"
+# Random bytes below 250 map uniformly onto ASCII digits; the rest are dropped
+_DIGIT_TABLE = bytes(0x30 + byte % 10 for byte in range(256))
+_DIGIT_REJECTS = bytes(range(250, 256))
+_DIGIT_PIECE = re.compile(b"." * JITTER_DIGITS, re.DOTALL)
+
+
+def parse_distribution(spec: str) -> AmountDistribution:
+    """Parse `fixed:VALUE`, `uniform:LOW:HIGH` or `lognormal:MEDIAN:SIGMA`."""
+    kind, *raw = spec.strip().split(":")
+    kind = kind.lower()
+    if kind not in _DISTRIBUTION_ARITY or len(raw) != _DISTRIBUTION_ARITY[kind]:
+        raise ValueError(
+            f"Invalid amount distribution: '{spec}'. "
+            "Expected fixed:VALUE, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA"
+        )
+    try:
+        params = tuple(Decimal(value) for value in raw)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount distribution: '{spec}'. Parameters must be numbers")
+    if not all(value.is_finite() and value > 0 for value in params):
+        raise ValueError(f"Invalid amount distribution: '{spec}'. Parameters must be positive")
+    if kind == "uniform" and params[0] > params[1]:
+        raise ValueError(f"Invalid amount distribution: '{spec}'. LOW must not exceed HIGH")
+    distribution: AmountDistribution = {"kind": kind, "params": params}  # type: ignore[typeddict-item]
+    return distribution
+
+
+def parse_asset_option(option: str) -> tuple[Asset, str]:
+    """Split an `ASSET=VALUE` command-line option."""
+    asset, separator, value = option.partition("=")
+    if not separator:
+        raise ValueError(f"Invalid option: '{option}'. Expected ASSET=VALUE")
+    return parse_asset(asset), value.strip()
+
+
+def parse_weights(spec: str) -> dict[Asset, float]:
+    """Parse an asset mix such as `BTC=1,ETH=1,USD=2` (unlisted assets get weight 0)."""
+    weights: dict[Asset, float] = {"BTC": 0.0, "ETH": 0.0, "USD": 0.0}
+    for part in spec.split(","):
+        asset, value = parse_asset_option(part)
+        try:
+            weights[asset] = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid weight for {asset}: '{value}'")
+    return weights
+
+
+def default_profile() -> LoadProfile:
+    """A retail-like mix: USD-heavy, 40% withdrawals, 5% of withdrawals failing."""
+    return {
+        "asset_weights": {"BTC": 0.25, "ETH": 0.25, "USD": 0.5},
+        "withdraw_ratio": 0.4,
+        "fail_rate": 0.05,
+        "amounts": {
+            "BTC": parse_distribution("lognormal:0.05:1.0"),
+            "ETH": parse_distribution("lognormal:1.5:1.0"),
+            "USD": parse_distribution("lognormal:250:1.2"),
+        },
+        "places": {"BTC": 8, "ETH": 8, "USD": 2},
+    }
+
+
+def _to_minor(value: Decimal, places: int) -> int:
+    minor = int(value.scaleb(places).to_integral_value())
+    if minor < 1:
+        raise ValueError(f"Amount {value} is below the smallest unit (10^-{places})")
+    return minor
+
+
+def _make_sampler(
+    distribution: AmountDistribution, places: int, rng: random.Random
+) -> tuple[_Sampler, int, float]:
+    """Return (sampler, lowest, highest) minor-unit amounts of a distribution."""
+    params = distribution["params"]
+    if distribution["kind"] == "fixed":
+        value = _to_minor(params[0], places)
+        return (lambda: value), value, value
+    if distribution["kind"] == "uniform":
+        low = _to_minor(params[0], places)
+        high = _to_minor(params[1], places)
+        span = high - low + 1
+        draw = rng.random
+        return (lambda: min(low + int(draw() * span), high)), low, high
+    mu = math.log(_to_minor(params[0], places))
+    sigma = float(params[1])
+    lognormvariate = rng.lognormvariate
+    return (lambda: max(1, int(lognormvariate(mu, sigma)))), 1, math.inf
+
+
+def _make_renderer(places: int) -> _Renderer:
+    if places == 0:
+        return lambda minor: b"%d" % minor
+    scale = 10**places
+    template = b"%%d.%%0%dd" % places
+    return lambda minor: template % divmod(minor, scale)
+
+
+def _validate(profile: LoadProfile, output_format: str) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: '{output_format}'")
+    weights = profile["asset_weights"]
+    if any(weight < 0 or not math.isfinite(weight) for weight in weights.values()):
+        raise ValueError("Asset weights must be finite and non-negative")
+    if sum(weights.values()) <= 0:
+        raise ValueError("At least one asset weight must be positive")
+    for name in ("withdraw_ratio", "fail_rate"):
+        if not 0.0 <= profile[name] <= 1.0:  # type: ignore[literal-required]
+            raise ValueError(f"{name} must be within [0, 1]")
+    if any(places < 0 for places in profile["places"].values()):
+        raise ValueError("Decimal places must be non-negative")
+    for asset, weight in weights.items():
+        if weight > 0 and (asset not in profile["amounts"] or asset not in profile["places"]):
+            raise ValueError(f"Missing amount distribution or decimal places for {asset}")
+
+
+def _line_affixes(output_format: str, type_name: str, asset: str) -> tuple[bytes, bytes]:
+    if output_format == "ndjson":
+        return b'{"type":"%s","asset":"%s","amount":' % (type_name.encode(), asset.encode()), b"}\n"
+    if output_format == "csv":
+        return f"{type_name},{asset},".encode(), b"\n"
+    return f"{type_name} {asset} ".encode(), b"\n"
+
+
+def make_load_generator(
+    profile: LoadProfile | None = None, seed: int = 0, output_format: str = "text"
+) -> tuple[GenerateFunc, SummaryFunc]:
+    """Create a deterministic transaction generator using a closure to hold its state.
+
+    Args:
+        profile: Workload shape (default: `default_profile()`); `amounts`/`places` entries
+            may be omitted for assets whose weight is 0.
+        seed: Seed of the private `random.Random`; equal seeds give the same transactions.
+        output_format: Encoding of the generated rows, one of `OUTPUT_FORMATS`.
+
+    Returns:
+        (generate, summary):
+            - generate(count, chunk_rows=DEFAULT_CHUNK_ROWS): validate the arguments and
+              return an iterator over the next `count` transactions as byte chunks (the
+              first CSV chunk of a generator is its header). Successive calls continue the
+              same stream; the output does not depend on `chunk_rows` or on how `count` is
+              split across calls.
+            - summary(): LoadSummary of everything generated so far, with the failed
+              withdrawals a wallet replaying the stream from zero balances will report.
+
+    Raises:
+        ValueError: If the profile or output format is invalid.
+    """
+    profile = profile or default_profile()
+    _validate(profile, output_format)
+    rng = random.Random(seed)
+    draw = rng.random
+    withdraw_ratio = profile["withdraw_ratio"]
+    fail_rate = profile["fail_rate"]
+    assets: list[Asset] = [a for a, w in profile["asset_weights"].items() if w > 0]
+    # One weighted draw picks both the asset and the transaction type
+    events: list[_Event] = []
+    event_weights = []
+    for slot, asset in enumerate(assets):
+        places = profile["places"][asset]
+        sample, low, high = _make_sampler(profile["amounts"][asset], places, rng)
+        render = _make_renderer(places)
+        # Jittering k digits needs k <= places and an amount of at least 10^(k+2)
+        digits = min(JITTER_DIGITS, places) if places else JITTER_DIGITS
+        thresholds = [10 ** (k + 2) for k in range(1, digits + 1)]
+        weight = profile["asset_weights"][asset]
+        for withdraw, type_name, share in (
+            (False, "DEPOSIT", 1 - withdraw_ratio),
+            (True, "WITHDRAW", withdraw_ratio),
+        ):
+            prefix, suffix = _line_affixes(output_format, type_name, asset)
+            events.append((withdraw, slot, sample, thresholds, low, high, prefix, suffix, render))
+            event_weights.append(weight * share)
+    cum_weights = list(accumulate(event_weights))
+    total_weight = cum_weights[-1]
+    last_event = len(cum_weights) - 1
+    scales = [10**k for k in range(JITTER_DIGITS + 1)]
+    # Bounds of the replayed balances after the blocks emitted so far
+    lower = [0] * len(assets)
+    upper = [0] * len(assets)
+    pool: list[_Template] = []
+    blocks = 0
+    block = b""
+    block_kinds = bytes(BLOCK_ROWS)
+    block_fails = bytearray(BLOCK_ROWS)
+    row_pos = BLOCK_ROWS
+    byte_pos = 0
+    counters: LoadSummary = {
+        "transactions": 0,
+        "deposits": 0,
+        "withdrawals": 0,
+        "failed_withdrawals": 0,
+    }
+    surplus = 0  # forced failures not yet offset by intended ones
+    header_written = False
+
+    def build_template() -> _Template:
+        lower_delta = [0] * len(assets)
+        upper_delta = [0] * len(assets)
+        lines: list[bytes] = []
+        append = lines.append
+        kinds = bytearray(BLOCK_ROWS)
+        holes: list[_Hole] = []
+        placeholders = 0
+        for row in range(BLOCK_ROWS):
+            withdraw, slot, sample, thresholds, low, high, prefix, suffix, render = events[
+                bisect(cum_weights, draw() * total_weight, 0, last_event)
+            ]
+            amount = sample()
+            if withdraw:
+                kinds[row] = 1
+                fail = draw() < fail_rate
+            k = bisect(thresholds, amount)
+            base = top = amount
+            if k:
+                base = amount - amount % scales[k]
+                top = base + scales[k] - 1
+                if base < low or top > high:
+                    k = 0
+                    base = top = amount
+            if withdraw and (fail or lower_delta[slot] < top):
+                holes.append(
+                    (
+                        row,
+                        placeholders,
+                        fail,
+                        slot,
+                        lower_delta[slot],
+                        upper_delta[slot],
+                        amount,
+                        render,
+                    )
+                )
+                append(prefix + _HOLE_PLACEHOLDER + suffix)
+                placeholders += 1
+                continue
+            if withdraw:
+                lower_delta[slot] -= top
+                upper_delta[slot] -= base
+            else:
+                lower_delta[slot] += base
+                upper_delta[slot] += top
+            if k:
+                append(prefix + render(base)[:-k] + _JITTER_PLACEHOLDERS[k] + suffix)
+                placeholders += 1
+            else:
+                append(prefix + render(amount) + suffix)
+        return b"".join(lines), bytes(kinds), placeholders, holes, lower_delta, upper_delta
+
+    def digit_pieces(count: int) -> list[bytes]:
+        size = count * JITTER_DIGITS
+        digits = b""
+        while len(digits) < size:
+            missing = size - len(digits)
+            digits += rng.randbytes(missing + (missing >> 5) + 64).translate(
+                _DIGIT_TABLE, _DIGIT_REJECTS
+            )
+        return _DIGIT_PIECE.findall(digits, 0, size)
+
+    def next_block() -> None:
+        nonlocal blocks, block, block_kinds, block_fails, surplus
+        blocks += 1
+        if len(pool) < TEMPLATE_POOL_SIZE:
+            template = build_template()
+            pool.append(template)
+        elif blocks % TEMPLATE_REFRESH_BLOCKS == 0:
+            template = build_template()
+            pool[blocks // TEMPLATE_REFRESH_BLOCKS % TEMPLATE_POOL_SIZE] = template
+        else:
+            template = pool[int(draw() * TEMPLATE_POOL_SIZE)]
+        text, block_kinds, placeholders, holes, lower_delta, upper_delta = template
+        block_fails = bytearray(BLOCK_ROWS)
+        if placeholders:
+            args: list[bytes] = digit_pieces(placeholders)
+            for row, index, fail, slot, lower_prefix, upper_prefix, amount, render in holes:
+                available = lower[slot]
+                if fail and surplus and available:
+                    surplus -= 1
+                    fail = False
+                elif not fail and not available:
+                    fail = True
+                    surplus += 1
+                if fail:
+                    block_fails[row] = 1
+                    args[index] = render(upper[slot] + upper_prefix + amount)  # above the balance
+                    continue
+                if amount > available:
+                    amount = 1 + int(draw() * available)
+                lower[slot] = available - amount
+                upper[slot] -= amount
+                args[index] = render(amount)
+            text = text % tuple(args)
+        for slot in range(len(assets)):
+            lower[slot] += lower_delta[slot]
+            upper[slot] += upper_delta[slot]
+        block = text
+
+    def take(rows: int) -> bytes:
+        nonlocal row_pos, byte_pos
+        parts: list[bytes] = []
+        withdrawals = failures = 0
+        remaining = rows
+        while remaining:
+            if row_pos == BLOCK_ROWS:
+                next_block()
+                row_pos = byte_pos = 0
+            taken = min(remaining, BLOCK_ROWS - row_pos)
+            if taken == BLOCK_ROWS - row_pos:
+                end = len(block)
+            else:
+                end = byte_pos
+                for _ in range(taken):
+                    end = block.index(b"\n", end) + 1
+            withdrawals += block_kinds.count(1, row_pos, row_pos + taken)
+            failures += block_fails.count(1, row_pos, row_pos + taken)
+            parts.append(block[byte_pos:end])
+            row_pos += taken
+            byte_pos = end
+            remaining -= taken
+        counters["transactions"] += rows
+        counters["deposits"] += rows - withdrawals
+        counters["withdrawals"] += withdrawals
+        counters["failed_withdrawals"] += failures
+        return b"".join(parts)
+
+    def chunks(count: int, chunk_rows: int) -> Iterator[bytes]:
+        nonlocal header_written
+        if output_format == "csv" and not header_written:
+            header_written = True
+            yield b"type,asset,amount\n"
+        remaining = count
+        while remaining:
+            rows = min(chunk_rows, remaining)
+            remaining -= rows
+            yield take(rows)
+
+    def generate(count: int, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[bytes]:
+        if count < 0 or chunk_rows < 1:
+            raise ValueError("count must be >= 0 and chunk_rows must be >= 1")
+        return chunks(count, chunk_rows)
+
+    def summary() -> LoadSummary:
+        return {**counters}
+
+    return generate, summary
@@ -0,0 +1,46 @@
+"""NDJSON (JSON Lines) input adapter - streams one transaction object per line.
+
+Each line is a JSON object such as `{"type": "DEPOSIT", "asset": "BTC", "amount": 1.5}`.
+Numbers are decoded straight into `Decimal` (never through `float`), so amounts keep
+their exact textual value; amounts given as JSON strings are accepted as well.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+
+from hedix_wallet.adapters.cli import build_transaction
+from hedix_wallet.domain.types import Transaction
+
+# Shared decoder: `json.loads(..., parse_float=...)` would build a new decoder per line
+_DECODER = json.JSONDecoder(parse_float=Decimal, parse_int=Decimal)
+
+
+def parse_ndjson_record(line: str) -> Transaction:
+    """Decode and validate a single NDJSON record."""
+    record = _DECODER.decode(line)
+    if not isinstance(record, dict):
+        raise ValueError("Invalid record: expected a JSON object")
+    try:
+        type_value, asset_value, amount_value = record["type"], record["asset"], record["amount"]
+    except KeyError as exc:
+        raise ValueError(f"Invalid record: missing field {exc}") from None
+    if not isinstance(type_value, str) or not isinstance(asset_value, str):
+        raise ValueError("Invalid record: 'type' and 'asset' must be strings")
+    return build_transaction(type_value, asset_value, amount_value)
+
+
+def iter_ndjson_transactions(lines: Iterable[str]) -> Iterator[Transaction]:
+    """Lazily decode NDJSON lines (blank lines are skipped).
+
+    Errors are re-raised as `ValueError` prefixed with the 1-based line number.
+    """
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield parse_ndjson_record(line)
+        except ValueError as exc:
+            raise ValueError(f"line {lineno}: {exc}") from exc
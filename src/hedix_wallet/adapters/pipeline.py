@@ -0,0 +1,161 @@
+"""Order-preserving parallel ingest: parse chunks in a process pool, apply in order.
+
+Stages:
+    1. split the input lines into chunks of `chunk_lines`
+    2. parse chunks concurrently in a `ProcessPoolExecutor`
+    3. reorder: a FIFO of futures in submission order, so chunks that finish early wait
+       until every earlier chunk has been handed on
+    4. apply: the caller consumes the resulting generator with a single in-order
+       `process` call, so balances are exactly those of serial processing
+
+Workers send results back in a compact columnar form (type/asset codes as `bytes`, amounts
+as their exact `str`) that is several times cheaper to pickle than `Transaction` dicts;
+the parent rebuilds each `Transaction` with `Decimal(str)`, which round-trips exactly.
+
+At most `max_in_flight` chunks are submitted but not yet consumed, which bounds memory
+regardless of input size. On a parse error every transaction before the offending line
+is still yielded (as the serial adapters do) and then `ValueError` is raised with the
+absolute line number.
+
+Only line-oriented formats (`text`, `ndjson`) can be split at arbitrary line boundaries.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from decimal import Decimal
+from itertools import islice
+from typing import cast
+
+from hedix_wallet.adapters.cli import parse_transaction
+from hedix_wallet.adapters.ndjson import parse_ndjson_record
+from hedix_wallet.domain.types import Asset, PositiveDecimal, Transaction, TransactionType
+
+DEFAULT_CHUNK_LINES = 10_000
+
+# (transactions parsed before any error, error message or None)
+ChunkResult = tuple[list[Transaction], "str | None"]
+ChunkParser = Callable[[int, list[str]], ChunkResult]
+# Wire form of a ChunkResult: (type codes, asset codes, amounts as text, error)
+EncodedChunk = tuple[bytes, bytes, list[str], "str | None"]
+
+_TYPES: tuple[TransactionType, ...] = ("DEPOSIT", "WITHDRAW")
+_ASSETS: tuple[Asset, ...] = ("BTC", "ETH", "USD")
+_TYPE_CODES = {name: code for code, name in enumerate(_TYPES)}
+_ASSET_CODES = {name: code for code, name in enumerate(_ASSETS)}
+
+
+def parse_text_chunk(first_lineno: int, lines: list[str]) -> ChunkResult:
+    """Parse `TYPE ASSET AMOUNT` lines (blank lines and `#` comments are skipped)."""
+    transactions: list[Transaction] = []
+    for offset, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            transactions.append(parse_transaction(stripped))
+        except ValueError as exc:
+            return transactions, f"line {first_lineno + offset}: {exc}"
+    return transactions, None
+
+
+def parse_ndjson_chunk(first_lineno: int, lines: list[str]) -> ChunkResult:
+    """Parse NDJSON lines (blank lines are skipped)."""
+    transactions: list[Transaction] = []
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            transactions.append(parse_ndjson_record(line))
+        except ValueError as exc:
+            return transactions, f"line {first_lineno + offset}: {exc}"
+    return transactions, None
+
+
+CHUNK_PARSERS: dict[str, ChunkParser] = {
+    "text": parse_text_chunk,
+    "ndjson": parse_ndjson_chunk,
+}
+
+
+def parse_encoded_chunk(input_format: str, first_lineno: int, lines: list[str]) -> EncodedChunk:
+    """Worker entry point: parse a chunk and encode it for the trip back to the parent."""
+    transactions, error = CHUNK_PARSERS[input_format](first_lineno, lines)
+    return (
+        bytes([_TYPE_CODES[tx["type"]] for tx in transactions]),
+        bytes([_ASSET_CODES[tx["asset"]] for tx in transactions]),
+        [str(tx["amount"]) for tx in transactions],
+        error,
+    )
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(lines)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _drain(future: Future[EncodedChunk]) -> Iterator[Transaction]:
+    types, assets, amounts, error = future.result()
+    for type_code, asset_code, amount in zip(types, assets, amounts):
+        yield {
+            "type": _TYPES[type_code],
+            "asset": _ASSETS[asset_code],
+            "amount": cast(PositiveDecimal, Decimal(amount)),
+        }
+    if error is not None:
+        raise ValueError(error)
+
+
+def iter_parallel_transactions(
+    lines: Iterable[str],
+    *,
+    input_format: str = "text",
+    workers: int | None = None,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+    max_in_flight: int | None = None,
+) -> Iterator[Transaction]:
+    """Parse `lines` on `workers` processes and yield transactions in input order.
+
+    Args:
+        lines: Input lines (e.g. an open file); read lazily, one chunk at a time.
+        input_format: `text` or `ndjson`.
+        workers: Worker processes (default: CPU count).
+        chunk_lines: Lines per chunk handed to a worker.
+        max_in_flight: Chunks parsed ahead of the consumer (default: 2 per worker).
+
+    Raises:
+        ValueError: For an unsupported format, invalid sizes, or invalid input lines.
+    """
+    if input_format not in CHUNK_PARSERS:
+        supported = ", ".join(CHUNK_PARSERS)
+        raise ValueError(f"Parallel parsing supports {supported}, not '{input_format}'")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    for name, value in (
+        ("workers", workers),
+        ("chunk_lines", chunk_lines),
+        ("max_in_flight", max_in_flight),
+    ):
+        if value < 1:
+            raise ValueError(f"{name} must be positive, got {value}")
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        in_flight: deque[Future[EncodedChunk]] = deque()
+        next_lineno = 1
+        for chunk in _chunks(lines, chunk_lines):
+            in_flight.append(pool.submit(parse_encoded_chunk, input_format, next_lineno, chunk))
+            next_lineno += len(chunk)
+            if len(in_flight) >= max_in_flight:
+                yield from _drain(in_flight.popleft())
+        while in_flight:
+            yield from _drain(in_flight.popleft())
+    finally:
+        # Also reached when the consumer stops early or an error propagates
+        pool.shutdown(wait=True, cancel_futures=True)
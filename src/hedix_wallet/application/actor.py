@@ -0,0 +1,185 @@
+"""Single-writer wallet actor with micro-batching.
+
+One worker thread owns the wallet: callers never touch its closures, they enqueue
+requests and get `concurrent.futures.Future`s back (await them from asyncio with
+`asyncio.wrap_future`). The worker drains the queue in micro-batches - up to `max_batch`
+requests, waiting at most `max_delay` seconds for a batch to fill - and applies each batch
+with one call to the wallet's batch `process`, recovering every caller's own outcome
+through the `observe` callback. Per-operation overhead (locking, wake-ups, dispatch) is
+thereby amortised across the batch while results stay strictly in submission order.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from decimal import Decimal
+from queue import Empty, SimpleQueue
+from typing import cast
+
+from hedix_wallet.domain.types import Asset, Balances, PositiveDecimal, ProcessFunc, Transaction
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY_SECONDS = 0.0005
+
+SubmitDepositFunc = Callable[[Asset, Decimal], "Future[None]"]
+SubmitWithdrawFunc = Callable[[Asset, Decimal], "Future[bool]"]
+SubmitSnapshotFunc = Callable[[], "Future[Balances]"]
+CloseFunc = Callable[[], None]
+
+# A queued request: a transaction (None for a snapshot) and the caller's future
+_Request = tuple["Transaction | None", Future]
+_STOP = None
+
+
+def make_wallet_actor(
+    process: ProcessFunc,
+    snapshot: Callable[[], Balances],
+    *,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+) -> tuple[SubmitDepositFunc, SubmitWithdrawFunc, SubmitSnapshotFunc, CloseFunc]:
+    """Start an actor thread that becomes the only writer of the given wallet.
+
+    Args:
+        process: The wallet's batch function (e.g. from the facade's `make_wallet`). After
+            this call only the actor may use the wallet.
+        snapshot: The same wallet's `snapshot` function.
+        max_batch: Maximum requests applied per batch (1 disables batching).
+        max_delay: Seconds to wait for more requests once a batch has started (0 applies
+            whatever is already queued).
+
+    Returns:
+        (deposit, withdraw, snapshot, close):
+            - deposit(asset, amount): Future[None]
+            - withdraw(asset, amount): Future[bool]  (False when insufficient funds)
+            - snapshot(): Future[Balances]  (consistent with every earlier submission)
+            - close(): apply everything already submitted, then stop the thread
+
+        Non-positive amounts raise `ValueError` at submission; any other failure of a
+        request is set on its own future without affecting the rest of the batch. A
+        failure that belongs to no single request (e.g. in `snapshot`) stops the actor:
+        it is set on every outstanding future and later submissions raise `RuntimeError`.
+    """
+    if max_batch < 1 or max_delay < 0:
+        raise ValueError("max_batch must be >= 1 and max_delay must be >= 0")
+
+    queue: SimpleQueue[_Request | None] = SimpleQueue()
+    closed = threading.Event()
+    submit_lock = threading.Lock()
+    outcomes: list[bool] = []
+    batch: list[_Request] = []
+    fatal: BaseException | None = None
+
+    def observe(_tx: Transaction, applied: bool) -> None:
+        outcomes.append(applied)
+
+    def apply(transactions: list[Transaction], futures: list[Future]) -> None:
+        start = 0
+        while start < len(transactions):
+            outcomes.clear()
+            failure: BaseException | None = None
+            try:
+                process(transactions[start:], observe)
+            except Exception as exc:  # belongs to the first transaction without an outcome
+                failure = exc
+            for future, tx, applied in zip(futures[start:], transactions[start:], list(outcomes)):
+                future.set_result(applied if tx["type"] == "WITHDRAW" else None)
+            start += len(outcomes)
+            if failure is not None:
+                if start == len(futures):
+                    raise failure  # raised after every transaction was applied
+                futures[start].set_exception(failure)
+                start += 1
+
+    def run_batch() -> None:
+        transactions: list[Transaction] = []
+        futures: list[Future] = []
+        for tx, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue  # cancelled by the caller before the batch ran
+            if tx is None:
+                apply(transactions, futures)
+                transactions, futures = [], []
+                future.set_result(snapshot())
+            else:
+                transactions.append(tx)
+                futures.append(future)
+        apply(transactions, futures)
+
+    def fail_outstanding(exc: BaseException) -> None:
+        nonlocal fatal
+        with submit_lock:
+            fatal = exc
+            closed.set()
+        pending = [future for _, future in batch]
+        while True:
+            try:
+                item = queue.get_nowait()
+            except Empty:
+                break
+            if item is not _STOP:
+                pending.append(item[1])
+        for future in pending:
+            if future.done():
+                continue
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+
+    def run() -> None:
+        stopping = False
+        try:
+            while not stopping:
+                first = queue.get()
+                if first is _STOP:
+                    break
+                batch[:] = [first]
+                deadline = time.monotonic() + max_delay
+                while len(batch) < max_batch:
+                    try:
+                        remaining = deadline - time.monotonic()
+                        item = queue.get(timeout=remaining) if remaining > 0 else queue.get_nowait()
+                    except Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                run_batch()
+        except BaseException as exc:  # never leave callers waiting on a dead thread
+            fail_outstanding(exc)
+
+    worker = threading.Thread(target=run, name="wallet-actor", daemon=True)
+    worker.start()
+
+    def submit(tx: Transaction | None) -> Future:
+        future: Future = Future()
+        with submit_lock:
+            if closed.is_set():
+                raise RuntimeError("Wallet actor is closed") from fatal
+            queue.put((tx, future))
+        return future
+
+    def deposit(asset: Asset, amount: Decimal) -> Future[None]:
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
+        return submit({"type": "DEPOSIT", "asset": asset, "amount": cast(PositiveDecimal, amount)})
+
+    def withdraw(asset: Asset, amount: Decimal) -> Future[bool]:
+        if amount <= 0:
+            raise ValueError("Withdraw amount must be positive")
+        return submit({"type": "WITHDRAW", "asset": asset, "amount": cast(PositiveDecimal, amount)})
+
+    def request_snapshot() -> Future[Balances]:
+        return submit(None)
+
+    def close() -> None:
+        with submit_lock:
+            if not closed.is_set():
+                closed.set()
+                queue.put(_STOP)
+        worker.join()
+
+    return deposit, withdraw, request_snapshot, close
@@ -5,11 +5,18 @@ from __future__ import annotations
 from collections.abc import Iterable
 
 from hedix_wallet.application.ports import WalletPort
-from hedix_wallet.domain.types import Balances, Transaction
+from hedix_wallet.domain.types import Balances, ObserveFunc, Transaction
 
 
-def process_transactions(transactions: Iterable[Transaction], port: WalletPort) -> Balances:
-    """Process a list of transactions against the provided wallet port."""
+def process_transactions(
+    transactions: Iterable[Transaction],
+    port: WalletPort,
+    observe: ObserveFunc | None = None,
+) -> Balances:
+    """Process a list of transactions against the provided wallet port.
+
+    When given, `observe(tx, applied)` is called after each transaction in the same pass.
+    """
     for tx in transactions:
         tx_type = tx["type"]
         tx_asset = tx["asset"]
@@ -17,9 +24,13 @@ def process_transactions(transactions: Iterable[Transaction], port: WalletPort)
 
         if tx_type == "DEPOSIT":
             port.deposit(tx_asset, tx_amount)
+            applied = True
         elif tx_type == "WITHDRAW":
-            port.withdraw(tx_asset, tx_amount)
+            applied = port.withdraw(tx_asset, tx_amount)
         else:
             raise ValueError(f"Unknown transaction type: {tx_type}")
 
+        if observe is not None:
+            observe(tx, applied)
+
     return port.snapshot()
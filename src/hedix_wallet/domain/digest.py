@@ -0,0 +1,143 @@
+"""Incremental, order-sensitive state digest for cheap replica consistency checks.
+
+`make_digest` returns an `observe(tx, applied)` callback (the same hook `make_stats` uses)
+that feeds every outcome into one running BLAKE2b hash in O(1) per transaction, so two
+replicas (or a replica and a checkpoint) agree when their few-byte digests are equal:
+
+- `stream` hashes the type, asset, amount and outcome of every transaction, in order
+- `balances` hashes the balances after those transactions
+
+Given the wallet's `snapshot`, the balances hash is taken from the wallet's own state
+whenever a digest is produced, so it also catches a wallet whose balances drifted from its
+reported outcomes. Without it the observer replays the outcomes into its own balances, and
+that hash is derived from the stream rather than an independent check.
+
+Each outcome is framed as a fixed tag plus the amount text and a newline, so distinct
+outcome streams never feed the hash the same bytes. Balances are hashed in normalized
+form, so numerically equal balances (`Decimal("1.50")` and `Decimal("1.5")`) hash alike,
+as `Balances` comparison does.
+
+With `checkpoint_every=N` a digest is also recorded at offset 0 and after every N
+transactions. A stream hash covers its whole prefix, so once two replicas' checkpoints
+differ every later one does too; `find_divergence` binary-searches for the first
+disagreement, and only that N-transaction window needs replaying.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from decimal import Decimal
+from hashlib import blake2b
+from typing import TypedDict
+
+from .types import Asset, Balances, ObserveFunc, Transaction
+
+DIGEST_SIZE = 16
+
+_ASSETS: tuple[Asset, ...] = ("BTC", "ETH", "USD")
+# One fixed-width tag per (type, asset, outcome); the amount text and b"\n" follow it
+_TAGS: dict[tuple[str, str, bool], bytes] = {
+    (tx_type, asset, applied): f"{tx_type[0]}{asset}{int(applied)}".encode()
+    for tx_type in ("DEPOSIT", "WITHDRAW")
+    for asset in _ASSETS
+    for applied in (False, True)
+}
+
+
+class WalletDigest(TypedDict):
+    offset: int  # transactions observed so far
+    stream: bytes  # hash of every (type, asset, amount, outcome) so far
+    balances: bytes  # hash of the balances after `offset` transactions
+
+
+DigestFunc = Callable[[], WalletDigest]
+CheckpointsFunc = Callable[[], list[WalletDigest]]
+
+
+def hash_balances(balances: Balances | Mapping[Asset, Decimal]) -> bytes:
+    """Hash BTC/ETH/USD balances (normalized, so numerically equal balances hash alike)."""
+    text = "|".join(str(balances[asset].normalize()) for asset in _ASSETS)
+    return blake2b(text.encode(), digest_size=DIGEST_SIZE).digest()
+
+
+def make_digest(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+    *,
+    checkpoint_every: int = 0,
+    snapshot: Callable[[], Balances | Mapping[Asset, Decimal]] | None = None,
+) -> tuple[ObserveFunc, DigestFunc, CheckpointsFunc]:
+    """Create a rolling digest using a closure to encapsulate state.
+
+    Args:
+        initial_balances: Starting balances of the observed wallet (missing assets are 0);
+            ignored with `snapshot`.
+        checkpoint_every: Record a digest at offset 0 and every N transactions (0: never).
+        snapshot: The observed wallet's `snapshot`; the balances hash is then computed from
+            it instead of from balances replayed out of the observed outcomes.
+
+    Returns:
+        (observe, digest, checkpoints):
+            - observe(tx, applied): fold one processed transaction into the digest
+            - digest(): WalletDigest of everything observed so far
+            - checkpoints(): the recorded WalletDigests, oldest first
+    """
+    if checkpoint_every < 0:
+        raise ValueError("checkpoint_every must be >= 0")
+    # Only maintained without `snapshot`; otherwise the wallet's own balances are hashed
+    replayed: Balances = {
+        asset: Decimal((initial_balances or {}).get(asset, Decimal("0"))) for asset in _ASSETS
+    }  # type: ignore[assignment]
+    stream = blake2b(digest_size=DIGEST_SIZE)
+    offset = 0
+    recorded: list[WalletDigest] = []
+
+    def digest() -> WalletDigest:
+        balances: Balances | Mapping[Asset, Decimal] = replayed if snapshot is None else snapshot()
+        return {"offset": offset, "stream": stream.digest(), "balances": hash_balances(balances)}
+
+    def observe(tx: Transaction, applied: bool) -> None:
+        nonlocal offset
+        asset = tx["asset"]
+        amount = tx["amount"]
+        stream.update(b"%s%s\n" % (_TAGS[(tx["type"], asset, applied)], str(amount).encode()))
+        if snapshot is None:
+            if tx["type"] == "DEPOSIT":
+                replayed[asset] = replayed[asset] + amount
+            elif applied:
+                replayed[asset] = replayed[asset] - amount
+        offset += 1
+        if checkpoint_every and offset % checkpoint_every == 0:
+            recorded.append(digest())
+
+    def checkpoints() -> list[WalletDigest]:
+        return list(recorded)
+
+    if checkpoint_every:
+        recorded.append(digest())
+    return observe, digest, checkpoints
+
+
+def find_divergence(left: Sequence[WalletDigest], right: Sequence[WalletDigest]) -> int | None:
+    """Binary-search two replicas' checkpoints for the first one that differs.
+
+    Both sequences must come from the same `checkpoint_every`; only their common prefix is
+    compared.
+
+    Returns:
+        The offset of the first differing checkpoint (the divergence happened in the
+        transactions since the previous checkpoint), or None when every common
+        checkpoint agrees.
+    """
+    common = min(len(left), len(right))
+    if any(left[i]["offset"] != right[i]["offset"] for i in (0, common - 1) if common):
+        raise ValueError("Checkpoints were recorded at different offsets")
+    if common == 0 or left[common - 1] == right[common - 1]:
+        return None
+    low, high = 0, common - 1  # `high` always differs
+    while low < high:
+        middle = (low + high) // 2
+        if left[middle] == right[middle]:
+            low = middle + 1
+        else:
+            high = middle
+    return left[high]["offset"]
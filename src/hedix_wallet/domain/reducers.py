@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
-from hedix_wallet.domain.types import Balances, Transaction
+from hedix_wallet.domain.types import Balances, ObserveFunc, Transaction
 
 
 def _clone(balances: Balances) -> Balances:
@@ -35,9 +35,20 @@ def compute_next_balances(balances: Balances, transaction: Transaction) -> Balan
     raise ValueError(f"Unknown transaction type: {ttype}")
 
 
-def compute_balances(initial_balances: Balances, transactions: Iterable[Transaction]) -> Balances:
-    """Return balances after applying all transactions in order (pure)."""
+def compute_balances(
+    initial_balances: Balances,
+    transactions: Iterable[Transaction],
+    observe: ObserveFunc | None = None,
+) -> Balances:
+    """Return balances after applying all transactions in order (pure).
+
+    When given, `observe(tx, applied)` is called after each transaction in the same pass.
+    """
     state = initial_balances
     for tx in transactions:
-        state = compute_next_balances(state, tx)
+        next_state = compute_next_balances(state, tx)
+        if observe is not None:
+            asset = tx["asset"]
+            observe(tx, tx["type"] == "DEPOSIT" or next_state[asset] != state[asset])
+        state = next_state
     return state
@@ -0,0 +1,165 @@
+"""Streaming per-asset statistics gathered in the same pass that applies transactions.
+
+`make_stats` returns an `observe(tx, applied)` callback that plugs into
+`process_transactions` / `compute_balances` (or the facade's `process`) together with query
+functions. Memory is O(1) per asset: plain counters plus two bounded quantile sketches.
+
+The sketches are log-bucketed histograms (DDSketch style): a value lands in bucket
+`ceil(log_gamma(value))`, so any reported quantile is within `SKETCH_RELATIVE_ACCURACY` of
+a true sample value. When a sketch exceeds `SKETCH_MAX_BINS` buckets the smallest ones are
+merged, trading accuracy on the low tail for a hard memory bound.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Callable, Mapping
+from decimal import Decimal
+from typing import Literal, TypeAlias, TypedDict
+
+from .types import Asset, ObserveFunc, Transaction
+
+SKETCH_RELATIVE_ACCURACY = 0.01
+SKETCH_MAX_BINS = 2048
+# Quantiles included in every `AssetStats` snapshot (and the rendered report)
+REPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+_GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+# Bucket indexes whose representative values are representable as floats
+_MAX_INDEX = math.floor(math.log(sys.float_info.max) / _LOG_GAMMA)
+_MIN_INDEX = math.ceil(math.log(sys.float_info.min * sys.float_info.epsilon) / _LOG_GAMMA)
+
+SizeKind: TypeAlias = Literal["DEPOSIT", "WITHDRAW"]
+
+
+class AssetStats(TypedDict):
+    deposit_count: int
+    deposit_volume: Decimal
+    withdraw_count: int
+    withdraw_volume: Decimal
+    failed_withdraw_count: int
+    failed_withdraw_volume: Decimal
+    balance: Decimal
+    min_balance: Decimal
+    max_balance: Decimal
+    # Approximate transaction sizes keyed by quantile (None when there were no samples)
+    deposit_quantiles: dict[float, float | None]
+    withdraw_quantiles: dict[float, float | None]
+
+
+WalletStats: TypeAlias = dict[Asset, AssetStats]
+StatsFunc = Callable[[], WalletStats]
+QuantileFunc = Callable[[Asset, SizeKind, float], "float | None"]
+
+
+class _Sketch(TypedDict):
+    bins: dict[int, int]
+    count: int
+
+
+def _sketch_add(sketch: _Sketch, value: Decimal) -> None:
+    magnitude = float(value)  # may overflow to inf or underflow to 0 for extreme Decimals
+    if magnitude == math.inf:
+        index = _MAX_INDEX
+    elif magnitude <= 0.0:
+        index = _MIN_INDEX
+    else:
+        index = min(max(math.ceil(math.log(magnitude) / _LOG_GAMMA), _MIN_INDEX), _MAX_INDEX)
+    bins = sketch["bins"]
+    bins[index] = bins.get(index, 0) + 1
+    sketch["count"] += 1
+    if len(bins) > SKETCH_MAX_BINS:
+        merged = bins.pop(min(bins))
+        bins[min(bins)] += merged
+
+
+def _sketch_quantile(sketch: _Sketch, q: float) -> float | None:
+    if not 0.0 <= q <= 1.0:
+        raise ValueError(f"Quantile must be within [0, 1]: {q}")
+    if sketch["count"] == 0:
+        return None
+    rank = q * (sketch["count"] - 1)
+    seen = 0
+    for index in sorted(sketch["bins"]):
+        seen += sketch["bins"][index]
+        if seen > rank:
+            return 2 * _GAMMA**index / (_GAMMA + 1)
+    raise AssertionError("unreachable: rank is below the total count")
+
+
+def make_stats(
+    initial_balances: Mapping[Asset, Decimal] | None = None,
+) -> tuple[ObserveFunc, StatsFunc, QuantileFunc]:
+    """Create a statistics aggregator using a closure to encapsulate state.
+
+    Args:
+        initial_balances: Starting balances of the observed wallet (missing assets are 0),
+            used to track the running balance and its min/max.
+
+    Returns:
+        (observe, stats, quantile):
+            - observe(tx, applied): record one processed transaction
+            - stats(): WalletStats snapshot for BTC/ETH/USD
+            - quantile(asset, kind, q): approximate size quantile of deposits or
+              successful withdrawals (None when there were none)
+    """
+    counters: dict[Asset, AssetStats] = {}
+    sketches: dict[tuple[Asset, SizeKind], _Sketch] = {}
+    for asset in ("BTC", "ETH", "USD"):
+        start = Decimal((initial_balances or {}).get(asset, Decimal("0")))
+        counters[asset] = {
+            "deposit_count": 0,
+            "deposit_volume": Decimal("0"),
+            "withdraw_count": 0,
+            "withdraw_volume": Decimal("0"),
+            "failed_withdraw_count": 0,
+            "failed_withdraw_volume": Decimal("0"),
+            "balance": start,
+            "min_balance": start,
+            "max_balance": start,
+            "deposit_quantiles": {},
+            "withdraw_quantiles": {},
+        }
+        sketches[(asset, "DEPOSIT")] = {"bins": {}, "count": 0}
+        sketches[(asset, "WITHDRAW")] = {"bins": {}, "count": 0}
+
+    def observe(tx: Transaction, applied: bool) -> None:
+        asset = tx["asset"]
+        amount = tx["amount"]
+        entry = counters[asset]
+        if tx["type"] == "DEPOSIT":
+            entry["deposit_count"] += 1
+            entry["deposit_volume"] += amount
+            balance = entry["balance"] + amount
+            entry["balance"] = balance
+            if balance > entry["max_balance"]:
+                entry["max_balance"] = balance
+            _sketch_add(sketches[(asset, "DEPOSIT")], amount)
+        elif applied:
+            entry["withdraw_count"] += 1
+            entry["withdraw_volume"] += amount
+            balance = entry["balance"] - amount
+            entry["balance"] = balance
+            if balance < entry["min_balance"]:
+                entry["min_balance"] = balance
+            _sketch_add(sketches[(asset, "WITHDRAW")], amount)
+        else:
+            entry["failed_withdraw_count"] += 1
+            entry["failed_withdraw_volume"] += amount
+
+    def quantile(asset: Asset, kind: SizeKind, q: float) -> float | None:
+        return _sketch_quantile(sketches[(asset, kind)], q)
+
+    def stats() -> WalletStats:
+        result: WalletStats = {}
+        for asset, entry in counters.items():
+            result[asset] = {
+                **entry,
+                "deposit_quantiles": {q: quantile(asset, "DEPOSIT", q) for q in REPORT_QUANTILES},
+                "withdraw_quantiles": {q: quantile(asset, "WITHDRAW", q) for q in REPORT_QUANTILES},
+            }
+        return result
+
+    return observe, stats, quantile
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable
 from decimal import Decimal
-from typing import Literal, NewType, TypeAlias, TypedDict
+from typing import Literal, NewType, Protocol, TypeAlias, TypedDict
 
 # Supported assets
 Asset: TypeAlias = Literal["BTC", "ETH", "USD"]
@@ -28,5 +28,13 @@ class Balances(TypedDict):
     USD: Decimal
 
 
-# Callable type alias for batch processing
-ProcessFunc: TypeAlias = Callable[[Iterable[Transaction]], Balances]
+# Callback receiving each processed transaction and whether it was applied
+# (False only for withdrawals rejected for insufficient funds)
+ObserveFunc: TypeAlias = Callable[[Transaction, bool], None]
+
+
+# Callable type for batch processing (`observe` is optional, hence a Protocol)
+class ProcessFunc(Protocol):
+    def __call__(
+        self, transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+    ) -> Balances: ...
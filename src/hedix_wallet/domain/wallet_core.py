@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
 from decimal import Decimal
 from typing import cast
 
@@ -13,10 +13,12 @@ from .types import Asset, Balances, PositiveDecimal, Transaction
 DepositFunc = Callable[[Asset, Decimal], None]
 WithdrawFunc = Callable[[Asset, Decimal], bool]
 SnapshotFunc = Callable[[], Balances]
+DepositManyFunc = Callable[[Asset, Sequence[Decimal]], None]
+WithdrawManyFunc = Callable[[Asset, Sequence[Decimal]], bytearray]
 
 
 def make_wallet(
-    initial_balances: Mapping[Asset, Decimal] | None = None,
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
 ) -> tuple[DepositFunc, WithdrawFunc, SnapshotFunc]:
     """Create a wallet using a clojure to encapsulate state.
 
@@ -26,6 +28,26 @@ def make_wallet(
     Returns:
         (deposit, withdraw, snapshot)
     """
+    deposit, withdraw, snapshot, _, _ = make_bulk_wallet(initial_balances)
+    return deposit, withdraw, snapshot
+
+
+def make_bulk_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+) -> tuple[DepositFunc, WithdrawFunc, SnapshotFunc, DepositManyFunc, WithdrawManyFunc]:
+    """Create a wallet like `make_wallet`, plus same-asset bulk variants sharing its state.
+
+    Args:
+        initial_balances: Optional initial balances. Missing assets default to 0.
+
+    Returns:
+        (deposit, withdraw, snapshot, deposit_many, withdraw_many)
+
+        The `*_many` variants apply a sequence of amounts for one asset in a single tight
+        loop with exactly the semantics of calling `deposit`/`withdraw` once per amount:
+        on an invalid amount the preceding ones stay applied and `ValueError` is raised.
+        `withdraw_many` returns one byte per amount (1 = succeeded, 0 = failed).
+    """
     balances: Balances = {
         "BTC": Decimal("0"),
         "ETH": Decimal("0"),
@@ -72,4 +94,43 @@ def make_wallet(
             "USD": balances["USD"],
         }
 
-    return deposit, withdraw, snapshot
+    def commit(asset: Asset, amount: Decimal) -> None:
+        nonlocal balances
+        next_balances = snapshot()
+        next_balances[asset] = amount
+        balances = next_balances
+
+    def deposit_many(asset: Asset, amounts: Sequence[Decimal]) -> None:
+        if not amounts:
+            return
+        current = balances[asset]
+        try:
+            for amount in amounts:
+                if amount <= 0:
+                    raise ValueError("Deposit amount must be positive")
+                current = current + amount
+        finally:
+            commit(asset, current)
+
+    def withdraw_many(asset: Asset, amounts: Sequence[Decimal]) -> bytearray:
+        results = bytearray()
+        if not amounts:
+            return results
+        append = results.append
+        current = balances[asset]
+        try:
+            for amount in amounts:
+                if amount <= 0:
+                    raise ValueError("Withdraw amount must be positive")
+                if current >= amount:
+                    remaining = current - amount
+                    # Same success rule as `withdraw`: the balance actually changed
+                    append(remaining != current)
+                    current = remaining
+                else:
+                    append(False)
+        finally:
+            commit(asset, current)
+        return results
+
+    return deposit, withdraw, snapshot, deposit_many, withdraw_many
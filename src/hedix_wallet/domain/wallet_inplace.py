@@ -0,0 +1,132 @@
+"""In-place wallet engine: same semantics as `wallet_core`, tuned for batch throughput.
+
+Instead of folding every transaction through the copy-on-write reducers, balances live in
+one private dict that is updated in place, and `process` applies a batch in a single
+inlined loop (no port dispatch, no per-transaction `Transaction`/`Balances` allocation).
+Results, including `Decimal` exponents, are identical to the reference engine because the
+same `Decimal` operations are performed in the same order.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from decimal import Decimal
+
+from .types import Asset, Balances, ObserveFunc, ProcessFunc, Transaction
+from .wallet_core import (
+    DepositFunc,
+    DepositManyFunc,
+    SnapshotFunc,
+    WithdrawFunc,
+    WithdrawManyFunc,
+)
+
+
+def make_inplace_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+) -> tuple[DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc, DepositManyFunc, WithdrawManyFunc]:
+    """Create an in-place wallet closure.
+
+    Args:
+        initial_balances: Optional initial balances. Missing assets default to 0.
+
+    Returns:
+        (deposit, withdraw, snapshot, process, deposit_many, withdraw_many) with the same
+        contract as the facade's `make_bulk_wallet`.
+    """
+    balances: dict[str, Decimal] = {
+        "BTC": Decimal("0"),
+        "ETH": Decimal("0"),
+        "USD": Decimal("0"),
+    }
+    if initial_balances:
+        for asset in ("BTC", "ETH", "USD"):
+            if asset in initial_balances:
+                amount = initial_balances[asset]
+                if amount < 0:
+                    raise ValueError(f"Balance cannot be negative: {asset}={amount}")
+                balances[asset] = Decimal(amount)
+
+    def deposit(asset: Asset, amount: Decimal) -> None:
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
+        balances[asset] = balances[asset] + amount
+
+    def withdraw(asset: Asset, amount: Decimal) -> bool:
+        if amount <= 0:
+            raise ValueError("Withdraw amount must be positive")
+        current = balances[asset]
+        if current >= amount:
+            remaining = current - amount
+            balances[asset] = remaining
+            # Same rule as `wallet_core`: success means the balance actually changed
+            # (a withdrawal rounded away by the Decimal context reports False)
+            return remaining != current
+        return False
+
+    def snapshot() -> Balances:
+        # Defensive copy
+        return {
+            "BTC": balances["BTC"],
+            "ETH": balances["ETH"],
+            "USD": balances["USD"],
+        }
+
+    def process(
+        transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+    ) -> Balances:
+        state = balances
+        for tx in transactions:
+            tx_type = tx["type"]
+            asset = tx["asset"]
+            amount = tx["amount"]
+            if tx_type == "DEPOSIT":
+                if amount <= 0:
+                    raise ValueError("Deposit amount must be positive")
+                state[asset] = state[asset] + amount
+                applied = True
+            elif tx_type == "WITHDRAW":
+                if amount <= 0:
+                    raise ValueError("Withdraw amount must be positive")
+                current = state[asset]
+                if current >= amount:
+                    remaining = current - amount
+                    state[asset] = remaining
+                    applied = remaining != current
+                else:
+                    applied = False
+            else:
+                raise ValueError(f"Unknown transaction type: {tx_type}")
+            if observe is not None:
+                observe(tx, applied)
+        return snapshot()
+
+    def deposit_many(asset: Asset, amounts: Sequence[Decimal]) -> None:
+        current = balances[asset]
+        try:
+            for amount in amounts:
+                if amount <= 0:
+                    raise ValueError("Deposit amount must be positive")
+                current = current + amount
+        finally:
+            balances[asset] = current
+
+    def withdraw_many(asset: Asset, amounts: Sequence[Decimal]) -> bytearray:
+        results = bytearray()
+        append = results.append
+        current = balances[asset]
+        try:
+            for amount in amounts:
+                if amount <= 0:
+                    raise ValueError("Withdraw amount must be positive")
+                if current >= amount:
+                    remaining = current - amount
+                    append(remaining != current)
+                    current = remaining
+                else:
+                    append(False)
+        finally:
+            balances[asset] = current
+        return results
+
+    return deposit, withdraw, snapshot, process, deposit_many, withdraw_many
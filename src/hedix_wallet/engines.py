@@ -0,0 +1,185 @@
+"""Engine registry: named wallet backends selectable through `make_wallet(engine=...)`.
+
+An engine is a factory `(initial_balances) -> (deposit, withdraw, snapshot, process,
+deposit_many, withdraw_many)` with exactly the facade's `make_bulk_wallet` contract; every
+registered engine must produce identical outcomes and balances (enforced by the
+differential tests). Built-in engines:
+
+- `reference`: the `wallet_core` closure over the pure Decimal reducers (the default)
+- `inplace`: `wallet_inplace`, the same Decimal arithmetic updated in place with an
+  inlined batch loop
+- `auto`: picks a backend per `process` call from the batch size and input type
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence, Sized
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import TypeAlias
+
+from hedix_wallet.application.ports import WalletPort
+from hedix_wallet.application.use_cases import process_transactions
+from hedix_wallet.domain.digest import CheckpointsFunc, DigestFunc, make_digest
+from hedix_wallet.domain.types import Asset, Balances, ObserveFunc, ProcessFunc, Transaction
+from hedix_wallet.domain.wallet_core import (
+    DepositFunc,
+    DepositManyFunc,
+    SnapshotFunc,
+    WithdrawFunc,
+    WithdrawManyFunc,
+)
+from hedix_wallet.domain.wallet_core import make_bulk_wallet as make_bulk_wallet_core
+from hedix_wallet.domain.wallet_inplace import make_inplace_wallet
+
+WalletFuncs: TypeAlias = tuple[DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc]
+BulkWalletFuncs: TypeAlias = tuple[
+    DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc, DepositManyFunc, WithdrawManyFunc
+]
+DigestWalletFuncs: TypeAlias = tuple[
+    DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc, DigestFunc, CheckpointsFunc
+]
+EngineFactory: TypeAlias = Callable[[Balances | Mapping[Asset, Decimal] | None], BulkWalletFuncs]
+
+DEFAULT_ENGINE = "reference"
+# `auto` moves to the batch engine for sized inputs at least this long (or any iterator)
+AUTO_BATCH_THRESHOLD = 64
+
+_ENGINES: dict[str, EngineFactory] = {}
+
+
+def register_engine(name: str, factory: EngineFactory) -> None:
+    """Register (or replace) an engine under `name`."""
+    _ENGINES[name] = factory
+
+
+def get_engine(name: str) -> EngineFactory:
+    try:
+        return _ENGINES[name]
+    except KeyError:
+        available = ", ".join(engine_names())
+        raise ValueError(f"Unknown engine: '{name}'. Available: {available}") from None
+
+
+def engine_names() -> list[str]:
+    return sorted(_ENGINES)
+
+
+def make_reference_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+) -> BulkWalletFuncs:
+    """Reference engine: `wallet_core` closure driven through the application use case."""
+    deposit, withdraw, snapshot, deposit_many, withdraw_many = make_bulk_wallet_core(
+        initial_balances
+    )
+    port: WalletPort = SimpleNamespace(deposit=deposit, withdraw=withdraw, snapshot=snapshot)
+
+    def process(
+        transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+    ) -> Balances:
+        return process_transactions(transactions, port, observe)
+
+    return deposit, withdraw, snapshot, process, deposit_many, withdraw_many
+
+
+def choose_engine(transactions: Iterable[Transaction], current: str) -> str:
+    """`auto` policy: batch engine for large or streaming input, otherwise stay put.
+
+    Small sized batches keep the current engine so that interleaved interactive calls
+    and short batches do not pay for a state migration.
+    """
+    if isinstance(transactions, Sized) and len(transactions) < AUTO_BATCH_THRESHOLD:
+        return current
+    return "inplace"
+
+
+def make_auto_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+) -> BulkWalletFuncs:
+    """Auto engine: starts on `reference` and migrates state when `choose_engine` says so.
+
+    Migration is O(1): the active engine's snapshot seeds the new engine.
+    """
+    active_name = DEFAULT_ENGINE
+    (
+        active_deposit,
+        active_withdraw,
+        active_snapshot,
+        active_process,
+        active_deposit_many,
+        active_withdraw_many,
+    ) = get_engine(active_name)(initial_balances)
+
+    def deposit(asset: Asset, amount: Decimal) -> None:
+        active_deposit(asset, amount)
+
+    def withdraw(asset: Asset, amount: Decimal) -> bool:
+        return active_withdraw(asset, amount)
+
+    def snapshot() -> Balances:
+        return active_snapshot()
+
+    def process(
+        transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+    ) -> Balances:
+        nonlocal active_name, active_deposit, active_withdraw, active_snapshot, active_process
+        nonlocal active_deposit_many, active_withdraw_many
+        name = choose_engine(transactions, active_name)
+        if name != active_name:
+            (
+                active_deposit,
+                active_withdraw,
+                active_snapshot,
+                active_process,
+                active_deposit_many,
+                active_withdraw_many,
+            ) = get_engine(name)(active_snapshot())
+            active_name = name
+        return active_process(transactions, observe)
+
+    def deposit_many(asset: Asset, amounts: Sequence[Decimal]) -> None:
+        active_deposit_many(asset, amounts)
+
+    def withdraw_many(asset: Asset, amounts: Sequence[Decimal]) -> bytearray:
+        return active_withdraw_many(asset, amounts)
+
+    return deposit, withdraw, snapshot, process, deposit_many, withdraw_many
+
+
+def make_digest_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+    engine: str = DEFAULT_ENGINE,
+    checkpoint_every: int = 0,
+) -> DigestWalletFuncs:
+    """Any engine plus a rolling state digest fed by both the interactive and batch paths."""
+    deposit, withdraw, snapshot, process, _, _ = get_engine(engine)(initial_balances)
+    # The balances hash reads the engine's own state, not a copy rebuilt from the outcomes
+    record, digest, checkpoints = make_digest(checkpoint_every=checkpoint_every, snapshot=snapshot)
+
+    def digest_deposit(asset: Asset, amount: Decimal) -> None:
+        deposit(asset, amount)
+        record({"type": "DEPOSIT", "asset": asset, "amount": amount}, True)  # type: ignore[typeddict-item]
+
+    def digest_withdraw(asset: Asset, amount: Decimal) -> bool:
+        applied = withdraw(asset, amount)
+        record({"type": "WITHDRAW", "asset": asset, "amount": amount}, applied)  # type: ignore[typeddict-item]
+        return applied
+
+    def digest_process(
+        transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+    ) -> Balances:
+        if observe is None:
+            return process(transactions, record)
+
+        def record_and_observe(tx: Transaction, applied: bool) -> None:
+            record(tx, applied)
+            observe(tx, applied)
+
+        return process(transactions, record_and_observe)
+
+    return digest_deposit, digest_withdraw, snapshot, digest_process, digest, checkpoints
+
+
+register_engine("reference", make_reference_wallet)
+register_engine("inplace", make_inplace_wallet)
+register_engine("auto", make_auto_wallet)
@@ -1,18 +1,27 @@
-"""Main entry point for the wallet application."""
+"""Main entry point for the wallet application.
 
-from decimal import Decimal
+Heavier imports are deferred into the functions that need them so that starting the
+`wallet` script only pays for what the invoked path actually uses.
+"""
 
-from hedix_wallet.wallet import (
-    Transaction,
-    format_balances,
-    make_wallet,
-)
+from __future__ import annotations
+
+# Equivalent to `typing.TYPE_CHECKING`, without paying for the `typing` import at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Iterable, Iterator
+
+    from hedix_wallet.wallet import Transaction
 
 DELIMITER = "-" * 60
+INPUT_FORMATS = ("text", "ndjson", "csv")
 
 
 def get_example_transactions() -> list[Transaction]:
     """Get the example transactions from the problm pdf, simulates a json."""
+    from decimal import Decimal
+
     return [
         {"type": "DEPOSIT", "asset": "BTC", "amount": Decimal("1.5")},
         {"type": "DEPOSIT", "asset": "USD", "amount": Decimal("1000")},
@@ -23,8 +32,10 @@ def get_example_transactions() -> list[Transaction]:
     ]
 
 
-def main() -> None:
+def run_example() -> None:
     """Run the wallet application with the example transactions in pdf."""
+    from hedix_wallet.wallet import format_balances, make_wallet
+
     print("=" * 60)
     print("Hedix Crypto Wallet")
     print("=" * 60)
@@ -70,5 +81,267 @@ def main() -> None:
     print("=" * 60)
 
 
+def read_lines(paths: list[str]) -> Iterator[str]:
+    """Stream lines from the given files in order (`-` or no paths means stdin)."""
+    import sys
+
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from sys.stdin
+        else:
+            with open(path, encoding="utf-8", newline="") as handle:
+                yield from handle
+
+
+def iter_input(input_format: str, lines: Iterable[str]) -> Iterator[Transaction]:
+    """Lazily decode `lines` with the adapter for `input_format` (text, ndjson or csv)."""
+    if input_format == "ndjson":
+        from hedix_wallet.adapters.ndjson import iter_ndjson_transactions
+
+        return iter_ndjson_transactions(lines)
+    if input_format == "csv":
+        from hedix_wallet.adapters.csv_format import iter_csv_transactions
+
+        return iter_csv_transactions(lines)
+    from hedix_wallet.adapters.cli import iter_transactions
+
+    return iter_transactions(lines)
+
+
+def run_process(args: argparse.Namespace) -> int:
+    """Stream transactions through the batch path and print the final balances."""
+    from hedix_wallet.wallet import format_balances, format_stats, make_stats, make_wallet
+
+    observe, stats, _ = make_stats() if args.stats else (None, None, None)
+    digest = None
+    if args.digest:
+        from hedix_wallet.wallet import make_digest_wallet
+
+        # The digest wallet records every outcome before calling `observe`
+        # and hashes the engine's own balances
+        _, _, _, process, digest, _ = make_digest_wallet(engine=args.engine)
+    else:
+        _, _, _, process = make_wallet(engine=args.engine)
+
+    lines = read_lines(args.files)
+    if args.workers is not None:
+        from hedix_wallet.adapters.pipeline import iter_parallel_transactions
+
+        transactions = iter_parallel_transactions(
+            lines, input_format=args.format, workers=args.workers
+        )
+    else:
+        transactions = iter_input(args.format, lines)
+    print(format_balances(process(transactions, observe)))
+    if stats is not None:
+        print(format_stats(stats()))
+    if digest is not None:
+        from hedix_wallet.wallet import format_digest
+
+        print(f"digest: {format_digest(digest())}")
+    return 0
+
+
+def run_daemon(args: argparse.Namespace) -> int:
+    """Keep one wallet resident and serve requests on a Unix domain socket."""
+    from hedix_wallet.adapters.cli import format_balances
+    from hedix_wallet.adapters.daemon import bind_socket, serve
+    from hedix_wallet.adapters.daemon_client import default_socket_path
+
+    socket_path = args.socket or default_socket_path()
+    listener = bind_socket(socket_path)
+    print(f"wallet daemon listening on {socket_path}", flush=True)
+    try:
+        final_balances = serve(listener)
+    except KeyboardInterrupt:
+        return 130
+    print(f"wallet daemon stopped: {format_balances(final_balances)}")
+    return 0
+
+
+def run_client(args: argparse.Namespace) -> int:
+    """Forward request lines (from `-e` or files/stdin) to the daemon, pipelined."""
+    import sys
+
+    from hedix_wallet.adapters.daemon_client import (
+        RESPONSE_BALANCES,
+        RESPONSE_ERROR,
+        default_socket_path,
+        request_lines,
+        send_requests,
+    )
+
+    def requests() -> Iterator[str]:
+        yield from request_lines(args.execute or [])
+        if args.files or not args.execute:
+            yield from request_lines(read_lines(args.files))
+        yield "SNAPSHOT"
+
+    status = 0
+    socket_path = args.socket or default_socket_path()
+    for number, response in enumerate(send_requests(socket_path, requests()), 1):
+        if response.startswith(RESPONSE_BALANCES):
+            print(response.removeprefix(RESPONSE_BALANCES).strip())
+        elif response.startswith(RESPONSE_ERROR):
+            print(f"wallet: request {number}: {response}", file=sys.stderr)
+            status = 1
+        elif args.verbose:
+            print(response)
+    return status
+
+
+def run_loadgen(args: argparse.Namespace) -> int:
+    """Write a deterministic synthetic workload in any supported input format."""
+    import sys
+
+    from hedix_wallet.adapters.loadgen import (
+        default_profile,
+        make_load_generator,
+        parse_asset_option,
+        parse_distribution,
+        parse_weights,
+    )
+
+    profile = default_profile()
+    if args.mix:
+        profile["asset_weights"] = parse_weights(args.mix)
+    if args.withdraw_ratio is not None:
+        profile["withdraw_ratio"] = args.withdraw_ratio
+    if args.fail_rate is not None:
+        profile["fail_rate"] = args.fail_rate
+    for option in args.amount or []:
+        asset, spec = parse_asset_option(option)
+        profile["amounts"][asset] = parse_distribution(spec)
+    for option in args.places or []:
+        asset, places = parse_asset_option(option)
+        try:
+            profile["places"][asset] = int(places)
+        except ValueError:
+            raise ValueError(f"Invalid decimal places for {asset}: '{places}'")
+
+    # Validate everything before the output file is opened (and truncated)
+    generate, summary = make_load_generator(profile, seed=args.seed, output_format=args.format)
+    chunks = generate(args.count)
+    if args.output in (None, "-"):
+        sys.stdout.flush()
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+    totals = summary()
+    rate = totals["failed_withdrawals"] / totals["withdrawals"] if totals["withdrawals"] else 0.0
+    print(
+        f"wallet loadgen: {totals['transactions']:,} transactions"
+        f" ({totals['deposits']:,} deposits, {totals['withdrawals']:,} withdrawals,"
+        f" {totals['failed_withdrawals']:,} failing = {rate:.2%})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    import argparse
+
+    from hedix_wallet.engines import DEFAULT_ENGINE, engine_names
+
+    parser = argparse.ArgumentParser(prog="wallet", description="Hedix crypto wallet.")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("example", help="run the example scenario (default)")
+
+    process = commands.add_parser("process", help="apply transactions from files or stdin")
+    process.add_argument(
+        "--format",
+        choices=INPUT_FORMATS,
+        default="text",
+        help="input format: 'TYPE ASSET AMOUNT' lines, JSON Lines or CSV (default: %(default)s)",
+    )
+    process.add_argument(
+        "--engine",
+        choices=engine_names(),
+        default=DEFAULT_ENGINE,
+        help="wallet engine (default: %(default)s)",
+    )
+    process.add_argument(
+        "--workers",
+        type=int,
+        help="parse text/ndjson input on N processes, applying in order (default: serial)",
+    )
+    process.add_argument(
+        "--stats", action="store_true", help="also print per-asset statistics (same pass)"
+    )
+    process.add_argument(
+        "--digest",
+        action="store_true",
+        help="also print the rolling state digest, for comparing replicas (same pass)",
+    )
+    process.add_argument("files", nargs="*", help="input files (default: stdin)")
+
+    socket_help = "daemon socket path (default: $HEDIX_WALLET_SOCKET or a per-user runtime path)"
+    daemon = commands.add_parser("daemon", help="serve a resident wallet on a Unix socket")
+    daemon.add_argument("--socket", help=socket_help)
+
+    client = commands.add_parser("client", help="send requests to a running daemon")
+    client.add_argument("--socket", help=socket_help)
+    client.add_argument(
+        "-e", "--execute", action="append", metavar="LINE", help="request line (repeatable)"
+    )
+    client.add_argument("-v", "--verbose", action="store_true", help="print every response")
+    client.add_argument("files", nargs="*", help="request files (default: stdin)")
+
+    loadgen = commands.add_parser("loadgen", help="generate a synthetic workload (deterministic)")
+    loadgen.add_argument("-n", "--count", type=int, default=1_000_000, help="transactions")
+    loadgen.add_argument("--seed", type=int, default=0, help="random seed (default: %(default)s)")
+    loadgen.add_argument(
+        "--format", choices=INPUT_FORMATS, default="text", help="output format (default: text)"
+    )
+    loadgen.add_argument("--mix", metavar="ASSET=W,...", help="asset weights, e.g. BTC=1,USD=3")
+    loadgen.add_argument(
+        "--withdraw-ratio", type=float, help="share of withdrawals among transactions (0.4)"
+    )
+    loadgen.add_argument(
+        "--fail-rate", type=float, help="target share of failing withdrawals (0.05)"
+    )
+    loadgen.add_argument(
+        "--amount",
+        action="append",
+        metavar="ASSET=DIST",
+        help="amount distribution: fixed:V, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA",
+    )
+    loadgen.add_argument(
+        "--places", action="append", metavar="ASSET=N", help="decimal places of an asset"
+    )
+    loadgen.add_argument("-o", "--output", help="output file (default: stdout)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Console entry point: dispatch to the selected subcommand."""
+    import sys
+
+    args = build_parser().parse_args(argv)
+    runners = {
+        "process": run_process,
+        "daemon": run_daemon,
+        "client": run_client,
+        "loadgen": run_loadgen,
+    }
+    runner = runners.get(args.command)
+    if runner is None:
+        run_example()
+        return 0
+    try:
+        return runner(args)
+    except (OSError, ValueError) as exc:
+        print(f"wallet: {exc}", file=sys.stderr)
+        return 1
+    except ArithmeticError as exc:
+        print(f"wallet: amount out of range ({type(exc).__name__})", file=sys.stderr)
+        return 1
+
+
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
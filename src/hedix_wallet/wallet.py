@@ -1,40 +1,108 @@
-"""Wallet facade exposing a small functional API by composing hexagonal pieces."""
+"""Wallet facade exposing a small functional API by composing hexagonal pieces.
+
+Re-exported names (types and CLI helpers) are resolved lazily through the module-level
+`__getattr__`, and the domain/application modules are only imported when a wallet is
+actually created, which keeps interpreter startup cheap for the `wallet` script.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-from decimal import Decimal
-from types import SimpleNamespace
-
-from hedix_wallet.adapters.cli import format_balances, parse_transaction
-from hedix_wallet.application.ports import WalletPort
-from hedix_wallet.application.use_cases import process_transactions as _process_use_case
-from hedix_wallet.domain.types import Asset, Balances, ProcessFunc, Transaction, TransactionType
-from hedix_wallet.domain.wallet_core import (
-    DepositFunc,
-    SnapshotFunc,
-    WithdrawFunc,
-)
-from hedix_wallet.domain.wallet_core import (
-    make_wallet as _make_wallet_core,
-)
+# Equivalent to `typing.TYPE_CHECKING`, without paying for the `typing` import at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from decimal import Decimal
+
+    from hedix_wallet.adapters.cli import (
+        format_balances,
+        format_digest,
+        format_stats,
+        parse_transaction,
+    )
+    from hedix_wallet.domain.digest import (
+        CheckpointsFunc,
+        DigestFunc,
+        WalletDigest,
+        find_divergence,
+        make_digest,
+    )
+    from hedix_wallet.domain.stats import make_stats
+    from hedix_wallet.domain.types import (
+        Asset,
+        Balances,
+        ObserveFunc,
+        ProcessFunc,
+        Transaction,
+        TransactionType,
+    )
+    from hedix_wallet.domain.wallet_core import (
+        DepositFunc,
+        DepositManyFunc,
+        SnapshotFunc,
+        WithdrawFunc,
+        WithdrawManyFunc,
+    )
 
 __all__ = [
     # Facade API
     "make_wallet",
+    "make_bulk_wallet",
+    "make_digest_wallet",
     # Re-exports to define the public API and avoid lint problemas
     "format_balances",
+    "format_stats",
+    "format_digest",
+    "make_stats",
+    "make_digest",
+    "find_divergence",
     "parse_transaction",
     "Asset",
     "Balances",
     "Transaction",
     "TransactionType",
     "ProcessFunc",
+    "ObserveFunc",
+    "WalletDigest",
 ]
 
+# Lazily re-exported names -> module that defines them
+_LAZY_EXPORTS = {
+    "format_balances": "hedix_wallet.adapters.cli",
+    "format_stats": "hedix_wallet.adapters.cli",
+    "format_digest": "hedix_wallet.adapters.cli",
+    "make_stats": "hedix_wallet.domain.stats",
+    "make_digest": "hedix_wallet.domain.digest",
+    "find_divergence": "hedix_wallet.domain.digest",
+    "WalletDigest": "hedix_wallet.domain.digest",
+    "parse_transaction": "hedix_wallet.adapters.cli",
+    "Asset": "hedix_wallet.domain.types",
+    "Balances": "hedix_wallet.domain.types",
+    "Transaction": "hedix_wallet.domain.types",
+    "TransactionType": "hedix_wallet.domain.types",
+    "ProcessFunc": "hedix_wallet.domain.types",
+    "ObserveFunc": "hedix_wallet.domain.types",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 def make_wallet(
-    initial_balances: Mapping[Asset, Decimal] | None = None,
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+    engine: str = "reference",
 ) -> tuple[DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc]:
     """Create a wallet and expose both interactive and batch APIs.
 
@@ -46,13 +114,20 @@ def make_wallet(
 
     Args:
         initial_balances: Optional starting balances for BTC/ETH/USD (defaults to 0).
+        engine: Registered backend name (see `hedix_wallet.engines`): "reference" (default,
+            Decimal reducers), "inplace" (batch-tuned) or "auto" (picks per batch).
+            All engines produce identical results.
 
     Returns:
         A 4-tuple:
             - deposit(asset, amount): None
             - withdraw(asset, amount): bool  (False when insufficient funds)
             - snapshot(): Balances  (defensive copy of current state)
-            - process(transactions): Balances  (applies all txs in order)
+            - process(transactions, observe=None): Balances  (applies all txs in order,
+              calling `observe(tx, applied)` after each one when given, e.g. `make_stats`)
+
+    Raises:
+        ValueError: If `engine` is not registered.
 
     Notes:
         - `process` is the “batch path” used when you already have a list of transactions
@@ -60,10 +135,57 @@ def make_wallet(
         - `deposit`/`withdraw` are the “interactive path” for incremental updates
           against the same wallet state.
     """
-    deposit, withdraw, snapshot = _make_wallet_core(initial_balances)
-
-    def process(transactions: Iterable[Transaction]) -> Balances:
-        port: WalletPort = SimpleNamespace(deposit=deposit, withdraw=withdraw, snapshot=snapshot)
-        return _process_use_case(transactions, port)
+    from hedix_wallet.engines import get_engine
 
+    deposit, withdraw, snapshot, process, _, _ = get_engine(engine)(initial_balances)
     return deposit, withdraw, snapshot, process
+
+
+def make_bulk_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+    engine: str = "reference",
+) -> tuple[DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc, DepositManyFunc, WithdrawManyFunc]:
+    """Create a wallet that also exposes the engine's bulk variants.
+
+    Args:
+        initial_balances: Optional starting balances for BTC/ETH/USD (defaults to 0).
+        engine: Registered backend name, as for `make_wallet`.
+
+    Returns:
+        A 6-tuple: the `make_wallet` functions followed by
+            - deposit_many(asset, amounts): None
+            - withdraw_many(asset, amounts): bytearray  (1/0 success per amount)
+
+        Both apply a sequence of same-asset amounts in one tight loop with exactly the
+        semantics of calling `deposit`/`withdraw` once per amount, sharing the same state.
+    """
+    from hedix_wallet.engines import get_engine
+
+    return get_engine(engine)(initial_balances)
+
+
+def make_digest_wallet(
+    initial_balances: Balances | Mapping[Asset, Decimal] | None = None,
+    engine: str = "reference",
+    checkpoint_every: int = 0,
+) -> tuple[DepositFunc, WithdrawFunc, SnapshotFunc, ProcessFunc, DigestFunc, CheckpointsFunc]:
+    """Create a wallet that maintains an incremental state digest next to `snapshot`.
+
+    Every transaction applied through `deposit`, `withdraw` or `process` is folded into an
+    order-sensitive rolling hash in O(1) (see `hedix_wallet.domain.digest`), so replicas
+    replaying the same stream can be compared by a few bytes instead of full `Balances`.
+
+    Args:
+        initial_balances: Optional starting balances for BTC/ETH/USD (defaults to 0).
+        engine: Registered backend name, as for `make_wallet`.
+        checkpoint_every: Also record a digest every N transactions (0: never); compare two
+            replicas' checkpoints with `find_divergence` to locate where they diverged.
+
+    Returns:
+        A 6-tuple: the `make_wallet` functions followed by
+            - digest(): WalletDigest  (offset, stream hash, hash of the wallet's balances)
+            - checkpoints(): list[WalletDigest]  (offset 0, N, 2N, ...)
+    """
+    from hedix_wallet.engines import make_digest_wallet as make_engine_digest_wallet
+
+    return make_engine_digest_wallet(initial_balances, engine, checkpoint_every)
@@ -0,0 +1,130 @@
+"""Integration tests for the resident wallet daemon and its pipelining client."""
+
+from __future__ import annotations
+
+import socket
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from hedix_wallet.adapters.daemon import bind_socket, make_request_handler, serve
+from hedix_wallet.adapters.daemon_client import request_lines, send_request, send_requests
+from hedix_wallet.wallet import Balances, make_wallet
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> Iterator[tuple[str, Future[Balances]]]:
+    socket_path = str(tmp_path / "wallet.sock")
+    listener = bind_socket(socket_path)
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        result = pool.submit(serve, listener, stop=stop)
+        yield socket_path, result
+        stop.set()
+
+
+class TestRequestHandler:
+    def test_handles_transactions_snapshot_and_errors(self) -> None:
+        deposit, withdraw, snapshot, _ = make_wallet()
+        handle = make_request_handler(deposit, withdraw, snapshot)
+        assert handle("DEPOSIT BTC 1.5") == "OK"
+        assert handle("WITHDRAW BTC 2") == "FAILED"
+        assert handle("withdraw btc 0.5") == "OK"
+        assert handle("DEPOSIT XRP 1").startswith("ERROR Invalid asset")
+        assert handle("snapshot") == "BALANCES BTC: 1.0, ETH: 0, USD: 0"
+
+
+class TestDaemon:
+    def test_pipelined_responses_are_in_request_order(
+        self, daemon: tuple[str, Future[Balances]]
+    ) -> None:
+        socket_path, _ = daemon
+        requests = ["DEPOSIT USD 1000", "WITHDRAW USD 300", "WITHDRAW BTC 1", "bogus", "SNAPSHOT"]
+        responses = list(send_requests(socket_path, requests))
+        assert responses[:3] == ["OK", "OK", "FAILED"]
+        assert responses[3].startswith("ERROR")
+        assert responses[4] == "BALANCES BTC: 0, ETH: 0, USD: 700"
+
+    def test_large_pipelined_stream_does_not_deadlock(
+        self, daemon: tuple[str, Future[Balances]]
+    ) -> None:
+        socket_path, _ = daemon
+        count = 50_000
+        requests = ("DEPOSIT ETH 0.01" for _ in range(count))
+        responses = list(send_requests(socket_path, requests))
+        assert len(responses) == count
+        assert set(responses) == {"OK"}
+        assert send_request(socket_path, "SNAPSHOT") == "BALANCES BTC: 0, ETH: 500.00, USD: 0"
+
+    def test_out_of_range_amount_is_an_error_and_daemon_keeps_serving(
+        self, daemon: tuple[str, Future[Balances]]
+    ) -> None:
+        socket_path, result = daemon
+        requests = ["DEPOSIT BTC 1", "DEPOSIT BTC 1e999999999", "DEPOSIT BTC 2"]
+        responses = list(send_requests(socket_path, requests))
+        assert responses[0] == "OK"
+        assert responses[1].startswith("ERROR Amount out of range")
+        assert responses[2] == "OK"
+        assert not result.done()
+        assert send_request(socket_path, "SNAPSHOT") == "BALANCES BTC: 3, ETH: 0, USD: 0"
+
+    def test_state_is_shared_across_connections(self, daemon: tuple[str, Future[Balances]]) -> None:
+        socket_path, _ = daemon
+        assert send_request(socket_path, "DEPOSIT BTC 2") == "OK"
+        assert send_request(socket_path, "WITHDRAW BTC 0.5") == "OK"
+        assert send_request(socket_path, "SNAPSHOT") == "BALANCES BTC: 1.5, ETH: 0, USD: 0"
+
+    def test_shutdown_returns_final_balances_and_removes_socket(
+        self, daemon: tuple[str, Future[Balances]]
+    ) -> None:
+        socket_path, result = daemon
+        assert list(send_requests(socket_path, ["DEPOSIT USD 5", "SHUTDOWN"])) == ["OK", "OK"]
+        assert result.result(timeout=5)["USD"] == Decimal("5")
+        assert not Path(socket_path).exists()
+
+    def test_shutdown_flushes_pending_responses_of_other_clients(
+        self, daemon: tuple[str, Future[Balances]]
+    ) -> None:
+        socket_path, result = daemon
+        count = 20_000  # responses far exceed the socket buffer, so some stay pending
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as reader:
+            reader.connect(socket_path)
+            sender = threading.Thread(
+                target=reader.sendall, args=(b"DEPOSIT ETH 1\n" + b"SNAPSHOT\n" * count,)
+            )
+            sender.start()
+            sender.join(timeout=10)
+            for _ in range(3):  # let the daemon apply everything the reader sent
+                send_request(socket_path, "SNAPSHOT")
+            assert send_request(socket_path, "SHUTDOWN") == "OK"
+            received = bytearray()
+            while chunk := reader.recv(1 << 16):
+                received += chunk
+        lines = received.decode().splitlines()
+        assert len(lines) == count + 1
+        assert lines[0] == "OK"
+        assert lines[-1] == "BALANCES BTC: 0, ETH: 1, USD: 0"
+        assert result.result(timeout=5)["ETH"] == Decimal("1")
+
+    def test_bind_refuses_socket_of_running_daemon(
+        self, daemon: tuple[str, Future[Balances]]
+    ) -> None:
+        socket_path, _ = daemon
+        with pytest.raises(OSError, match="already listening"):
+            bind_socket(socket_path)
+
+    def test_bind_replaces_stale_socket_file(self, tmp_path: Path) -> None:
+        socket_path = str(tmp_path / "stale.sock")
+        bind_socket(socket_path).close()  # leaves the socket file behind
+        listener = bind_socket(socket_path)
+        listener.close()
+
+
+class TestRequestLines:
+    def test_drops_blank_lines_and_comments(self) -> None:
+        lines = ["DEPOSIT BTC 1\n", "\n", "  # note\n", "  WITHDRAW BTC 1  \n"]
+        assert list(request_lines(lines)) == ["DEPOSIT BTC 1", "WITHDRAW BTC 1"]
@@ -0,0 +1,138 @@
+"""Differential tests: every registered engine must match the reference engine exactly.
+
+Randomized workloads (seeded, so failures are reproducible) interleave interactive
+deposits/withdrawals and their bulk `*_many` variants with batches given as lists or
+generators, then compare every
+outcome, every observed `(tx, applied)` pair and every snapshot, including the textual
+form of the balances (so `Decimal` exponents must match too).
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator, Mapping
+from decimal import Decimal
+from typing import cast
+
+import pytest
+
+from hedix_wallet import engines
+from hedix_wallet.domain.types import Asset, PositiveDecimal, Transaction
+from hedix_wallet.engines import (
+    AUTO_BATCH_THRESHOLD,
+    BulkWalletFuncs,
+    engine_names,
+    register_engine,
+)
+from hedix_wallet.wallet import make_bulk_wallet, make_wallet
+
+SEEDS = range(40)
+ASSETS: tuple[Asset, ...] = ("BTC", "ETH", "USD")
+
+Trace = list[object]
+
+
+def _random_amount(rng: random.Random) -> PositiveDecimal:
+    places = rng.choice((0, 1, 2, 8, 18))
+    units = rng.choice((1, rng.randint(1, 100), rng.randint(1, 10**12)))
+    return cast(PositiveDecimal, Decimal(units).scaleb(-places))
+
+
+def _random_transactions(rng: random.Random, count: int) -> list[Transaction]:
+    return [
+        {
+            "type": rng.choice(("DEPOSIT", "WITHDRAW")),
+            "asset": rng.choice(ASSETS),
+            "amount": _random_amount(rng),
+        }
+        for _ in range(count)
+    ]
+
+
+def _run_workload(engine: str, seed: int) -> Trace:
+    rng = random.Random(seed)
+    initial = {asset: _random_amount(rng) for asset in ASSETS if rng.random() < 0.5}
+    deposit, withdraw, snapshot, process, deposit_many, withdraw_many = make_bulk_wallet(
+        initial, engine=engine
+    )
+    trace: Trace = []
+
+    def observe(tx: Transaction, applied: bool) -> None:
+        trace.append((tx["type"], tx["asset"], tx["amount"], applied))
+
+    for _ in range(rng.randint(5, 25)):
+        step = rng.random()
+        if step < 0.4:
+            asset, amount = rng.choice(ASSETS), _random_amount(rng)
+            if rng.random() < 0.5:
+                trace.append(("deposit", deposit(asset, amount)))
+            else:
+                trace.append(("withdraw", withdraw(asset, amount)))
+        elif step < 0.55:
+            asset = rng.choice(ASSETS)
+            amounts = [_random_amount(rng) for _ in range(rng.choice((0, 1, 20)))]
+            if rng.random() < 0.5:
+                trace.append(("deposit_many", deposit_many(asset, amounts)))
+            else:
+                trace.append(("withdraw_many", bytes(withdraw_many(asset, amounts))))
+        else:
+            size = rng.choice((0, 1, 5, AUTO_BATCH_THRESHOLD - 1, AUTO_BATCH_THRESHOLD, 300))
+            txs = _random_transactions(rng, size)
+            source: list[Transaction] | Iterator[Transaction] = (
+                txs if rng.random() < 0.5 else iter(txs)
+            )
+            result = process(source, observe if rng.random() < 0.7 else None)
+            trace.append(("process", {asset: str(value) for asset, value in result.items()}))
+        trace.append(("snapshot", {asset: str(value) for asset, value in snapshot().items()}))
+    return trace
+
+
+class TestEngineParity:
+    def test_builtin_engines_are_registered(self) -> None:
+        assert {"reference", "inplace", "auto"} <= set(engine_names())
+
+    @pytest.mark.parametrize("engine", [name for name in engine_names() if name != "reference"])
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_engine_matches_reference(self, engine: str, seed: int) -> None:
+        assert _run_workload(engine, seed) == _run_workload("reference", seed)
+
+    @pytest.mark.parametrize("engine", engine_names())
+    def test_engines_validate_identically(self, engine: str) -> None:
+        deposit, withdraw, _, process = make_wallet(engine=engine)
+        with pytest.raises(ValueError, match="positive"):
+            deposit("BTC", Decimal("0"))
+        with pytest.raises(ValueError, match="positive"):
+            withdraw("BTC", Decimal("-1"))
+        with pytest.raises(ValueError, match="positive"):
+            process([{"type": "DEPOSIT", "asset": "BTC", "amount": Decimal("-1")}] * 100)
+        with pytest.raises(ValueError, match="Unknown transaction type"):
+            process([{"type": "TRANSFER", "asset": "BTC", "amount": Decimal("1")}] * 100)
+        with pytest.raises(ValueError, match="cannot be negative"):
+            make_wallet({"BTC": Decimal("-1")}, engine=engine)
+
+    @pytest.mark.parametrize("engine", engine_names())
+    def test_bulk_variants_validate_identically(self, engine: str) -> None:
+        _, _, snapshot, _, deposit_many, withdraw_many = make_bulk_wallet(engine=engine)
+        with pytest.raises(ValueError, match="positive"):
+            deposit_many("BTC", [Decimal("2"), Decimal("3"), Decimal("0"), Decimal("100")])
+        with pytest.raises(ValueError, match="positive"):
+            withdraw_many("BTC", [Decimal("1"), Decimal("-1"), Decimal("1")])
+        assert str(snapshot()["BTC"]) == "4"  # amounts before the invalid one stay applied
+
+    def test_unknown_engine_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown engine: 'gpu'"):
+            make_wallet(engine="gpu")
+
+    def test_registered_engine_is_selectable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(engines, "_ENGINES", dict(engines._ENGINES))
+        calls: list[object] = []
+
+        def tracing_engine(initial: Mapping[Asset, Decimal] | None) -> BulkWalletFuncs:
+            calls.append(initial)
+            return make_bulk_wallet(initial)
+
+        register_engine("tracing", tracing_engine)
+        _, _, snapshot, _ = make_wallet({"USD": Decimal("1")}, engine="tracing")
+        assert snapshot()["USD"] == Decimal("1")
+        assert calls == [{"USD": Decimal("1")}]
+        assert "tracing" in engine_names()
@@ -0,0 +1,149 @@
+"""Memory-footprint regression tests for the streaming processing paths.
+
+Each path (every registered engine plus the lower layers) consumes a transaction
+generator; peak traced memory must not grow with the number of transactions. Input sizes
+default to values that keep the suite fast; set `HEDIX_MEMORY_TX` (e.g.
+`HEDIX_MEMORY_TX=5000000`) to push multi-million-transaction streams through every path.
+Run with `-s` to see bytes per transaction for each path.
+"""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+
+from hedix_wallet.adapters.cli import iter_transactions
+from hedix_wallet.application.ports import WalletPort
+from hedix_wallet.application.use_cases import process_transactions
+from hedix_wallet.domain.reducers import compute_balances
+from hedix_wallet.domain.stats import make_stats
+from hedix_wallet.domain.types import Asset, Balances, PositiveDecimal, Transaction
+from hedix_wallet.domain.wallet_core import make_wallet as make_wallet_core
+from hedix_wallet.engines import engine_names
+from hedix_wallet.wallet import make_wallet
+
+LARGE_COUNT = int(os.environ.get("HEDIX_MEMORY_TX", "100000"))
+SMALL_COUNT = max(LARGE_COUNT // 10, 1)
+# Allowed peak growth between the small and the large run (allocator/arena noise)
+FLAT_TOLERANCE_BYTES = 32 * 1024
+
+ASSETS: tuple[Asset, ...] = ("BTC", "ETH", "USD")
+AMOUNTS = [cast(PositiveDecimal, Decimal(f"{n}.{n:02d}")) for n in range(1, 50)]
+
+Engine = Callable[[int], Balances]
+
+
+def _transactions(count: int) -> Iterator[Transaction]:
+    for i in range(count):
+        yield {
+            "type": "WITHDRAW" if i % 4 == 3 else "DEPOSIT",
+            "asset": ASSETS[i % 3],
+            "amount": AMOUNTS[i % len(AMOUNTS)],
+        }
+
+
+def _lines(count: int) -> Iterable[str]:
+    return (f"{tx['type']} {tx['asset']} {tx['amount']}" for tx in _transactions(count))
+
+
+def _facade(count: int) -> Balances:
+    _, _, _, process = make_wallet()
+    return process(_transactions(count))
+
+
+def _facade_with_stats(count: int) -> Balances:
+    _, _, _, process = make_wallet()
+    observe, _, _ = make_stats()
+    return process(_transactions(count), observe)
+
+
+def _use_case(count: int) -> Balances:
+    deposit, withdraw, snapshot = make_wallet_core()
+    port: WalletPort = SimpleNamespace(deposit=deposit, withdraw=withdraw, snapshot=snapshot)
+    return process_transactions(_transactions(count), port)
+
+
+def _reducers(count: int) -> Balances:
+    initial: Balances = {"BTC": Decimal("0"), "ETH": Decimal("0"), "USD": Decimal("0")}
+    return compute_balances(initial, _transactions(count))
+
+
+def _text_adapter(count: int) -> Balances:
+    _, _, _, process = make_wallet()
+    return process(iter_transactions(_lines(count)))
+
+
+def _registered(engine: str) -> Engine:
+    def run(count: int) -> Balances:
+        _, _, _, process = make_wallet(engine=engine)
+        return process(_transactions(count))
+
+    return run
+
+
+ENGINES: dict[str, Engine] = {
+    **{f"engine:{name}": _registered(name) for name in engine_names()},
+    "facade": _facade,
+    "facade+stats": _facade_with_stats,
+    "use case": _use_case,
+    "reducers": _reducers,
+    "text adapter": _text_adapter,
+}
+
+
+def _measure(engine: Engine, count: int) -> tuple[int, int]:
+    """Return `(peak, retained)` traced bytes above the pre-run baseline."""
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = engine(count)
+    current, peak = tracemalloc.get_traced_memory()
+    del result
+    return peak - baseline, current - baseline
+
+
+@pytest.fixture
+def traced() -> Iterator[None]:
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.usefixtures("traced")
+class TestStreamingMemory:
+    @pytest.mark.parametrize("name", list(ENGINES))
+    def test_peak_memory_is_flat_with_input_size(
+        self, name: str, record_property: Callable[[str, object], None]
+    ) -> None:
+        engine = ENGINES[name]
+        engine(SMALL_COUNT)  # warm up caches and lazy imports outside the measurement
+        small_peak, _ = _measure(engine, SMALL_COUNT)
+        large_peak, large_retained = _measure(engine, LARGE_COUNT)
+
+        growth = large_peak - small_peak
+        per_tx = max(growth, 0) / (LARGE_COUNT - SMALL_COUNT)
+        record_property("bytes_per_tx", per_tx)
+        print(
+            f"\n{name:>13}: peak {small_peak:,} B @ {SMALL_COUNT:,} tx -> "
+            f"{large_peak:,} B @ {LARGE_COUNT:,} tx ({per_tx:.4f} B/tx), "
+            f"retained {large_retained:,} B"
+        )
+        assert growth <= FLAT_TOLERANCE_BYTES
+        assert large_retained <= FLAT_TOLERANCE_BYTES
+
+    def test_detects_materialized_input(self) -> None:
+        # Guard the guard: a path that does `list(transactions)` must fail the budget
+        def materializing(count: int) -> Balances:
+            _, _, _, process = make_wallet()
+            return process(list(_transactions(count)))
+
+        small_peak, _ = _measure(materializing, SMALL_COUNT)
+        large_peak, _ = _measure(materializing, LARGE_COUNT)
+        assert large_peak - small_peak > FLAT_TOLERANCE_BYTES
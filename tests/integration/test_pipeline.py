@@ -0,0 +1,83 @@
+"""Integration tests for the order-preserving parallel parse / apply pipeline."""
+
+from __future__ import annotations
+
+import random
+from itertools import islice
+
+import pytest
+
+from hedix_wallet.adapters.cli import iter_transactions
+from hedix_wallet.adapters.ndjson import iter_ndjson_transactions
+from hedix_wallet.adapters.pipeline import iter_parallel_transactions
+from hedix_wallet.wallet import Transaction, make_wallet
+
+
+def _text_lines(count: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        if i % 97 == 0:
+            lines.append("# comment\n" if i % 2 else "\n")
+            continue
+        kind = rng.choice(("DEPOSIT", "WITHDRAW"))
+        asset = rng.choice(("BTC", "ETH", "USD"))
+        lines.append(f"{kind} {asset} {rng.randint(1, 10**6)}.{rng.randint(0, 99):02d}\n")
+    return lines
+
+
+def _ndjson_lines(text_lines: list[str]) -> list[str]:
+    records = []
+    for line in text_lines:
+        parts = line.split()
+        if len(parts) == 3:
+            records.append(f'{{"type": "{parts[0]}", "asset": "{parts[1]}", "amount": {parts[2]}}}')
+    return records
+
+
+class TestParallelPipeline:
+    def test_yields_transactions_in_input_order(self) -> None:
+        lines = _text_lines(3000)
+        parallel = list(iter_parallel_transactions(lines, workers=2, chunk_lines=128))
+        assert parallel == list(iter_transactions(lines))
+
+    @pytest.mark.parametrize("engine", ["reference", "inplace"])
+    def test_balances_match_serial_processing(self, engine: str) -> None:
+        lines = _text_lines(5000, seed=5)
+        _, _, _, serial = make_wallet(engine=engine)
+        _, _, _, parallel = make_wallet(engine=engine)
+        expected = serial(iter_transactions(lines))
+        result = parallel(
+            iter_parallel_transactions(lines, workers=3, chunk_lines=100, max_in_flight=2)
+        )
+        assert {a: str(v) for a, v in result.items()} == {a: str(v) for a, v in expected.items()}
+
+    def test_ndjson_format(self) -> None:
+        records = _ndjson_lines(_text_lines(2000))
+        parallel = list(
+            iter_parallel_transactions(records, input_format="ndjson", workers=2, chunk_lines=64)
+        )
+        assert parallel == list(iter_ndjson_transactions(records))
+
+    def test_error_applies_preceding_lines_and_reports_absolute_line(self) -> None:
+        lines = ["DEPOSIT BTC 1\n"] * 250 + ["DEPOSIT XRP 1\n"] + ["DEPOSIT BTC 1\n"] * 10
+        applied: list[Transaction] = []
+        with pytest.raises(ValueError, match="line 251: Invalid asset"):
+            for tx in iter_parallel_transactions(lines, workers=2, chunk_lines=100):
+                applied.append(tx)
+        assert len(applied) == 250
+
+    def test_consumer_can_stop_early(self) -> None:
+        transactions = iter_parallel_transactions(_text_lines(5000), workers=2, chunk_lines=50)
+        assert len(list(islice(transactions, 10))) == 10
+        transactions.close()  # shuts the pool down without hanging
+
+    def test_rejects_unsupported_format_and_sizes(self) -> None:
+        with pytest.raises(ValueError, match="supports text, ndjson"):
+            list(iter_parallel_transactions([], input_format="csv"))
+        with pytest.raises(ValueError, match="chunk_lines must be positive, got 0"):
+            list(iter_parallel_transactions([], chunk_lines=0))
+        with pytest.raises(ValueError, match="workers must be positive, got 0"):
+            list(iter_parallel_transactions([], workers=0))
+        with pytest.raises(ValueError, match="max_in_flight must be positive, got 0"):
+            list(iter_parallel_transactions([], workers=1, max_in_flight=0))
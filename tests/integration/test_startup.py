@@ -0,0 +1,80 @@
+"""Integration tests for import laziness and the CLI startup budget."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import hedix_wallet
+
+# Cumulative `-X importtime` budgets in microseconds (override for slow machines)
+PACKAGE_IMPORT_BUDGET_US = int(os.environ.get("HEDIX_PACKAGE_IMPORT_BUDGET_US", "20000"))
+MAIN_IMPORT_BUDGET_US = int(os.environ.get("HEDIX_MAIN_IMPORT_BUDGET_US", "60000"))
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    return subprocess.run(
+        [sys.executable, *args], check=True, env=env, capture_output=True, text=True
+    )
+
+
+def _cumulative_import_us(module: str) -> int:
+    result = _run_python("-X", "importtime", "-c", f"import {module}")
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative_us, name = line.removeprefix("import time:").split("|")
+            if name.strip() == module:
+                return int(cumulative_us)
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+class TestStartup:
+    def test_import_package_does_not_load_submodules(self) -> None:
+        result = _run_python(
+            "-c",
+            "import sys, hedix_wallet; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('hedix_wallet'))))",
+        )
+        assert result.stdout.split() == ["hedix_wallet"]
+
+    def test_import_main_does_not_load_domain(self) -> None:
+        result = _run_python(
+            "-c",
+            "import sys, hedix_wallet.main; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('hedix_wallet'))))",
+        )
+        assert result.stdout.split() == ["hedix_wallet", "hedix_wallet.main"]
+
+    def test_cli_adapter_does_not_load_stats_or_digest(self) -> None:
+        result = _run_python(
+            "-c",
+            "import sys, hedix_wallet.adapters.cli; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('hedix_wallet'))))",
+        )
+        loaded = result.stdout.split()
+        assert "hedix_wallet.domain.stats" not in loaded
+        assert "hedix_wallet.domain.digest" not in loaded
+
+    def test_public_api_resolves_lazily(self) -> None:
+        from hedix_wallet import wallet
+
+        for name in hedix_wallet.__all__:
+            assert getattr(hedix_wallet, name) is not None
+        assert hedix_wallet.make_wallet is wallet.make_wallet
+        assert hedix_wallet.parse_transaction is wallet.parse_transaction
+        assert set(hedix_wallet.__all__) <= set(dir(hedix_wallet))
+
+    def test_unknown_attribute_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = hedix_wallet.missing  # type: ignore[attr-defined]
+
+    def test_package_import_within_budget(self) -> None:
+        assert _cumulative_import_us("hedix_wallet") <= PACKAGE_IMPORT_BUDGET_US
+
+    def test_main_import_within_budget(self) -> None:
+        assert _cumulative_import_us("hedix_wallet.main") <= MAIN_IMPORT_BUDGET_US
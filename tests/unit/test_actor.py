@@ -0,0 +1,184 @@
+"""Unit tests for the single-writer wallet actor."""
+
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future
+from decimal import Decimal
+
+import pytest
+
+from hedix_wallet.application.actor import (
+    DEFAULT_MAX_BATCH,
+    DEFAULT_MAX_DELAY_SECONDS,
+    CloseFunc,
+    SubmitDepositFunc,
+    SubmitSnapshotFunc,
+    SubmitWithdrawFunc,
+    make_wallet_actor,
+)
+from hedix_wallet.wallet import Balances, ObserveFunc, Transaction, make_wallet
+
+
+def _actor(
+    engine: str = "reference",
+    *,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+) -> tuple[SubmitDepositFunc, SubmitWithdrawFunc, SubmitSnapshotFunc, CloseFunc]:
+    _, _, snapshot, process = make_wallet(engine=engine)
+    return make_wallet_actor(process, snapshot, max_batch=max_batch, max_delay=max_delay)
+
+
+class TestWalletActor:
+    @pytest.mark.parametrize("max_batch", [1, 4, 256])
+    def test_each_caller_gets_its_own_result(self, max_batch: int) -> None:
+        deposit, withdraw, snapshot, close = _actor(max_batch=max_batch)
+        futures: list[Future] = [
+            deposit("BTC", Decimal("1")),
+            withdraw("BTC", Decimal("0.4")),
+            withdraw("BTC", Decimal("5")),
+            withdraw("ETH", Decimal("1")),
+            withdraw("BTC", Decimal("0.6")),
+        ]
+        balances = snapshot()
+        close()
+        assert [future.result() for future in futures] == [None, True, False, False, True]
+        assert balances.result() == {
+            "BTC": Decimal("0.0"),
+            "ETH": Decimal("0"),
+            "USD": Decimal("0"),
+        }
+
+    def test_snapshot_sees_every_earlier_submission(self) -> None:
+        deposit, _, snapshot, close = _actor(max_batch=1000, max_delay=0.01)
+        deposit("USD", Decimal("10"))
+        first = snapshot()
+        deposit("USD", Decimal("5"))
+        second = snapshot()
+        close()
+        assert first.result()["USD"] == Decimal("10")
+        assert second.result()["USD"] == Decimal("15")
+
+    def test_matches_serial_processing_under_concurrent_submitters(self) -> None:
+        deposit, withdraw, snapshot, close = _actor(engine="inplace", max_batch=32)
+        results: dict[int, list[Future]] = {}
+
+        def submitter(worker: int) -> None:
+            results[worker] = [
+                deposit("ETH", Decimal("2")) if i % 2 == 0 else withdraw("ETH", Decimal("1"))
+                for i in range(200)
+            ]
+
+        threads = [threading.Thread(target=submitter, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        balances = snapshot().result()
+        close()
+        # Every withdrawal follows a deposit from the same thread, so none can fail
+        assert all(f.result() in (None, True) for fs in results.values() for f in fs)
+        assert balances["ETH"] == Decimal("400")
+
+    def test_non_positive_amount_is_rejected_at_submission(self) -> None:
+        deposit, withdraw, _, close = _actor()
+        with pytest.raises(ValueError, match="Deposit amount must be positive"):
+            deposit("BTC", Decimal("0"))
+        with pytest.raises(ValueError, match="Withdraw amount must be positive"):
+            withdraw("BTC", Decimal("-1"))
+        close()
+
+    def test_failure_is_isolated_to_its_own_future(self) -> None:
+        deposit, withdraw, snapshot, close = _actor(max_batch=100, max_delay=0.01)
+        before = deposit("BTC", Decimal("1"))
+        bad = deposit("DOGE", Decimal("1"))  # type: ignore[arg-type]
+        after = withdraw("BTC", Decimal("1"))
+        balances = snapshot()
+        close()
+        assert before.result() is None
+        with pytest.raises(KeyError):
+            bad.result()
+        assert after.result() is True
+        assert balances.result()["BTC"] == Decimal("0")
+
+    def test_cancelled_request_is_not_applied(self) -> None:
+        gate = threading.Event()
+        _, _, snapshot, process = make_wallet()
+
+        def gated_process(
+            transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+        ) -> Balances:
+            gate.wait()
+            return process(transactions, observe)
+
+        deposit, _, request_snapshot, close = make_wallet_actor(
+            gated_process, snapshot, max_batch=1
+        )
+        deposit("BTC", Decimal("1"))  # blocks the actor inside process
+        cancelled = deposit("BTC", Decimal("100"))
+        assert cancelled.cancel()
+        gate.set()
+        balances = request_snapshot().result()
+        close()
+        assert balances["BTC"] == Decimal("1")
+
+    def test_failing_snapshot_fails_outstanding_requests_and_stops_the_actor(self) -> None:
+        gate = threading.Event()
+        _, _, snapshot, process = make_wallet()
+
+        def gated_process(
+            transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+        ) -> Balances:
+            gate.wait()
+            return process(transactions, observe)
+
+        def broken_snapshot() -> Balances:
+            raise OSError("snapshot store unavailable")
+
+        deposit, _, request_snapshot, close = make_wallet_actor(
+            gated_process, broken_snapshot, max_batch=100
+        )
+        before = deposit("BTC", Decimal("1"))  # blocks the actor inside process
+        balances = request_snapshot()
+        after = deposit("BTC", Decimal("2"))
+        gate.set()
+        assert before.result(timeout=5) is None
+        with pytest.raises(OSError, match="unavailable"):
+            balances.result(timeout=5)
+        with pytest.raises(OSError, match="unavailable"):
+            after.result(timeout=5)
+        with pytest.raises(RuntimeError, match="closed") as excinfo:
+            deposit("BTC", Decimal("1"))
+        assert isinstance(excinfo.value.__cause__, OSError)
+        close()  # returns although the worker already stopped
+
+    def test_failure_after_the_last_outcome_stops_the_actor(self) -> None:
+        _, _, snapshot, process = make_wallet()
+
+        def failing_process(
+            transactions: Iterable[Transaction], observe: ObserveFunc | None = None
+        ) -> Balances:
+            process(transactions, observe)
+            raise OSError("journal write failed")
+
+        deposit, _, _, close = make_wallet_actor(failing_process, snapshot, max_batch=1)
+        applied = deposit("BTC", Decimal("1"))
+        assert applied.result(timeout=5) is None
+        close()
+        with pytest.raises(RuntimeError, match="closed"):
+            deposit("BTC", Decimal("1"))
+
+    def test_close_applies_pending_requests_and_rejects_new_ones(self) -> None:
+        deposit, _, _, close = _actor(max_delay=0.05)
+        pending = [deposit("USD", Decimal("1")) for _ in range(10)]
+        close()
+        close()  # idempotent
+        assert all(future.done() for future in pending)
+        with pytest.raises(RuntimeError, match="closed"):
+            deposit("USD", Decimal("1"))
+
+    def test_invalid_batch_settings_are_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            _actor(max_batch=0)
+        with pytest.raises(ValueError):
+            _actor(max_delay=-1)
@@ -4,7 +4,7 @@ from decimal import Decimal
 
 import pytest
 
-from hedix_wallet.wallet import format_balances, parse_transaction
+from hedix_wallet.wallet import format_balances, format_stats, make_stats, parse_transaction
 
 
 class TestParsingAndFormatting:
@@ -63,3 +63,20 @@ class TestParsingAndFormatting:
         assert "BTC: 0" in formatted
         assert "ETH: 0" in formatted
         assert "USD: 100.0" in formatted
+
+    def test_parse_transaction_non_finite_amount_raises_error(self) -> None:
+        with pytest.raises(ValueError, match="Invalid amount"):
+            parse_transaction("DEPOSIT BTC NaN")
+        with pytest.raises(ValueError, match="Invalid amount"):
+            parse_transaction("DEPOSIT BTC Infinity")
+
+    def test_format_stats_renders_each_asset(self) -> None:
+        observe, stats, _ = make_stats()
+        observe({"type": "DEPOSIT", "asset": "BTC", "amount": Decimal("2")}, True)
+        observe({"type": "WITHDRAW", "asset": "BTC", "amount": Decimal("3")}, False)
+        report = format_stats(stats())
+        assert "BTC: deposits 1 (volume 2)" in report
+        assert "failed withdrawals 1 (volume 3)" in report
+        assert "balance 2 (min 0, max 2)" in report
+        assert "withdraw size p50/p90/p99: - / - / -" in report
+        assert report.splitlines()[4].startswith("ETH:")
@@ -0,0 +1,133 @@
+"""Unit tests for the incremental state digest."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from hedix_wallet.domain.digest import hash_balances
+from hedix_wallet.engines import engine_names
+from hedix_wallet.wallet import (
+    Transaction,
+    find_divergence,
+    make_digest,
+    make_digest_wallet,
+    make_stats,
+    make_wallet,
+)
+
+
+def _tx(tx_type: str, asset: str, amount: str) -> Transaction:
+    return {"type": tx_type, "asset": asset, "amount": Decimal(amount)}  # type: ignore[typeddict-item]
+
+
+def _stream(count: int, poison: int | None = None) -> list[Transaction]:
+    transactions = []
+    for i in range(count):
+        amount = "999" if i == poison else f"{i % 7 + 1}.5"
+        transactions.append(_tx("DEPOSIT" if i % 3 else "WITHDRAW", "BTC", amount))
+    return transactions
+
+
+class TestDigest:
+    def test_engines_and_paths_agree(self) -> None:
+        transactions = _stream(200)
+        digests = []
+        for engine in engine_names():
+            _, _, _, process, digest, _ = make_digest_wallet(engine=engine)
+            process(transactions)
+            digests.append(digest())
+        deposit, withdraw, _, _, digest, _ = make_digest_wallet()
+        for tx in transactions:
+            if tx["type"] == "DEPOSIT":
+                deposit(tx["asset"], tx["amount"])
+            else:
+                withdraw(tx["asset"], tx["amount"])
+        digests.append(digest())
+        assert all(d == digests[0] for d in digests)
+        assert digests[0]["offset"] == 200
+        assert len(digests[0]["stream"]) == len(digests[0]["balances"]) == 16
+
+    def test_balances_hash_matches_snapshot(self) -> None:
+        _, _, snapshot, process, digest, _ = make_digest_wallet({"ETH": Decimal("3")})
+        process(_stream(50))
+        assert digest()["balances"] == hash_balances(snapshot())
+
+    def test_balances_hash_reads_wallet_state_not_the_stream(self) -> None:
+        deposit, _, snapshot, _ = make_wallet()
+        observe, digest, _ = make_digest(snapshot=snapshot)
+        replay_observe, replay_digest, _ = make_digest()
+        tx = _tx("DEPOSIT", "BTC", "1")
+        deposit("BTC", Decimal("1"))
+        observe(tx, True)
+        replay_observe(tx, True)
+        assert digest() == replay_digest()
+        deposit("BTC", Decimal("1"))  # state drifts from the observed outcomes
+        assert digest()["stream"] == replay_digest()["stream"]
+        assert digest()["balances"] != replay_digest()["balances"]
+        assert digest()["balances"] == hash_balances(snapshot())
+
+    def test_checkpoints_hash_the_live_balances(self) -> None:
+        transactions = _stream(200)
+        _, _, _, process, _, checkpoints = make_digest_wallet(checkpoint_every=100)
+        process(transactions)
+        _, _, snapshot, process_prefix = make_wallet()
+        process_prefix(transactions[:100])
+        assert checkpoints()[1]["balances"] == hash_balances(snapshot())
+
+    def test_stream_is_order_and_outcome_sensitive(self) -> None:
+        a = [_tx("DEPOSIT", "USD", "1"), _tx("DEPOSIT", "USD", "2")]
+        b = [_tx("DEPOSIT", "USD", "2"), _tx("DEPOSIT", "USD", "1")]
+        first, second = make_digest(), make_digest()
+        for tx in a:
+            first[0](tx, True)
+        for tx in b:
+            second[0](tx, True)
+        assert first[1]()["balances"] == second[1]()["balances"]
+        assert first[1]()["stream"] != second[1]()["stream"]
+
+        failed, succeeded = make_digest(), make_digest()
+        failed[0](_tx("WITHDRAW", "USD", "1"), False)
+        succeeded[0](_tx("WITHDRAW", "USD", "1"), True)
+        assert failed[1]()["stream"] != succeeded[1]()["stream"]
+
+    def test_numerically_equal_balances_hash_alike(self) -> None:
+        one = {"BTC": Decimal("1.50"), "ETH": Decimal("0"), "USD": Decimal("2")}
+        two = {"BTC": Decimal("1.5"), "ETH": Decimal("0.00"), "USD": Decimal("2.0")}
+        assert hash_balances(one) == hash_balances(two)  # type: ignore[arg-type]
+
+    def test_caller_observe_still_runs(self) -> None:
+        observe, stats, _ = make_stats()
+        _, _, _, process, digest, _ = make_digest_wallet(engine="inplace")
+        process(_stream(30), observe)
+        assert digest()["offset"] == 30
+        assert stats()["BTC"]["deposit_count"] == 20
+
+    def test_checkpoints_bisect_to_the_divergent_window(self) -> None:
+        replicas = []
+        for poison in (None, 537):
+            _, _, _, process, _, checkpoints = make_digest_wallet(checkpoint_every=100)
+            process(_stream(1000, poison))
+            replicas.append(checkpoints())
+        assert [c["offset"] for c in replicas[0]] == list(range(0, 1001, 100))
+        assert find_divergence(replicas[0], replicas[0]) is None
+        assert find_divergence(replicas[0], replicas[1]) == 600
+        assert find_divergence(replicas[0][:5], replicas[1]) is None
+
+    def test_divergent_initial_balances_are_found_at_offset_zero(self) -> None:
+        left = make_digest_wallet(checkpoint_every=10)
+        right = make_digest_wallet({"USD": Decimal("1")}, checkpoint_every=10)
+        for wallet in (left, right):
+            wallet[3](_stream(40))
+        assert find_divergence(left[5](), right[5]()) == 0
+
+    def test_mismatched_cadence_is_rejected(self) -> None:
+        _, _, checkpoints_10 = make_digest(checkpoint_every=10)
+        observe, _, checkpoints_5 = make_digest(checkpoint_every=5)
+        for tx in _stream(5):
+            observe(tx, True)
+        with pytest.raises(ValueError, match="different offsets"):
+            find_divergence(checkpoints_10() + checkpoints_10(), checkpoints_5())
+        with pytest.raises(ValueError):
+            make_digest(checkpoint_every=-1)
@@ -0,0 +1,115 @@
+"""Unit tests for the bulk snapshot exporter."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from hedix_wallet.adapters.export import iter_binary_balances, make_exporter
+from hedix_wallet.wallet import Balances, make_wallet
+
+SNAPSHOTS: list[Balances] = [
+    {"BTC": Decimal("1.50"), "ETH": Decimal("0"), "USD": Decimal("700")},
+    {"BTC": Decimal("1E+3"), "ETH": Decimal("0.00000001"), "USD": Decimal("-0.00")},
+    {"BTC": Decimal("123456789012345678901234567890.5"), "ETH": Decimal("2"), "USD": Decimal("1")},
+]
+IDS = ["w1", 'odd, "id"', "w3"]
+
+
+def _export(output_format: str, ids: list[str] | None = None, **options: int) -> bytes:
+    stream = io.BytesIO()
+    write_batch, flush = make_exporter(stream, output_format, with_ids=ids is not None, **options)
+    write_batch(SNAPSHOTS[:1], None if ids is None else ids[:1])
+    write_batch(SNAPSHOTS[1:], None if ids is None else ids[1:])
+    flush()
+    return stream.getvalue()
+
+
+def _same_text(decoded: list[Balances]) -> None:
+    # Exact round trip, including each Decimal's exponent
+    assert [{k: str(v) for k, v in b.items()} for b in decoded] == [
+        {k: str(v) for k, v in b.items()} for b in SNAPSHOTS
+    ]
+
+
+class TestExporter:
+    @pytest.mark.parametrize("ids", [None, IDS])
+    def test_ndjson_round_trip(self, ids: list[str] | None) -> None:
+        lines = _export("ndjson", ids).decode().splitlines()
+        records = [json.loads(line, parse_float=Decimal, parse_int=Decimal) for line in lines]
+        assert [r.pop("id", None) for r in records] == (ids or [None] * 3)
+        _same_text(records)
+
+    @pytest.mark.parametrize("ids", [None, IDS])
+    def test_csv_round_trip(self, ids: list[str] | None) -> None:
+        rows = list(csv.DictReader(io.StringIO(_export("csv", ids).decode())))
+        assert [r.pop("id", None) for r in rows] == (ids or [None] * 3)
+        _same_text([{k: Decimal(v) for k, v in r.items()} for r in rows])  # type: ignore[misc]
+
+    @pytest.mark.parametrize("ids", [None, IDS])
+    def test_binary_round_trip(self, ids: list[str] | None) -> None:
+        decoded = list(iter_binary_balances(_export("binary", ids)))
+        assert [record_id for record_id, _ in decoded] == (ids or [None] * 3)
+        _same_text([balances for _, balances in decoded])
+
+    def test_binary_is_compact(self) -> None:
+        assert len(_export("binary")) < len(_export("csv")) < len(_export("ndjson"))
+
+    def test_output_is_buffered_until_flush(self) -> None:
+        stream = io.BytesIO()
+        write_batch, flush = make_exporter(stream, "csv", buffer_size=10_000)
+        assert write_batch(SNAPSHOTS) > 0
+        assert stream.getvalue() == b""
+        flush()
+        assert stream.getvalue().startswith(b"BTC,ETH,USD\n")
+
+        small = io.BytesIO()
+        write_batch, _ = make_exporter(small, "csv", buffer_size=1)
+        write_batch(SNAPSHOTS)
+        assert small.getvalue().count(b"\n") == 4
+
+    def test_cache_distinguishes_equal_values_with_different_exponents(self) -> None:
+        batch: list[Balances] = [
+            {"BTC": Decimal("1.5"), "ETH": Decimal("0"), "USD": Decimal("0")},
+            {"BTC": Decimal("1.50"), "ETH": Decimal("0.0"), "USD": Decimal("0E+2")},
+        ]
+        stream = io.BytesIO()
+        write_batch, flush = make_exporter(stream, "csv", cache_size=2)
+        for _ in range(3):
+            write_batch(batch)
+            # Temporary Decimals may reuse ids of freed ones; output must stay exact
+            write_batch(
+                [{"BTC": Decimal(f"{n}.1"), "ETH": Decimal(n), "USD": Decimal(0)} for n in range(5)]
+            )
+        flush()
+        rows = stream.getvalue().decode().splitlines()
+        assert rows[1:3] == ["1.5,0,0", "1.50,0.0,0E+2"]
+        assert rows[3:8] == [f"{n}.1,{n},0" for n in range(5)]
+        assert rows[8:10] == rows[1:3]
+
+    def test_wallet_snapshots_export(self) -> None:
+        deposit, _, snapshot, _ = make_wallet()
+        stream = io.BytesIO()
+        write_batch, flush = make_exporter(stream)
+        for amount in ("1", "2.5"):
+            deposit("ETH", Decimal(amount))
+            write_batch([snapshot()])
+        flush()
+        assert stream.getvalue() == (b'{"BTC":0,"ETH":1,"USD":0}\n{"BTC":0,"ETH":3.5,"USD":0}\n')
+
+    def test_invalid_usage_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            make_exporter(io.BytesIO(), "xml")
+        write_batch, _ = make_exporter(io.BytesIO(), with_ids=True)
+        with pytest.raises(ValueError, match="ids must be given"):
+            write_batch(SNAPSHOTS)
+        with pytest.raises(ValueError):
+            write_batch(SNAPSHOTS, IDS[:1])
+        with pytest.raises(ValueError, match="Not a binary"):
+            list(iter_binary_balances(b"BTC,ETH,USD\n"))
+        with pytest.raises(ValueError, match="Truncated"):
+            list(iter_binary_balances(_export("binary")[:-1]))
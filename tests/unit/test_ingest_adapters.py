@@ -0,0 +1,89 @@
+"""Unit tests for the streaming NDJSON and CSV input adapters."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+
+from hedix_wallet.adapters.csv_format import iter_csv_transactions
+from hedix_wallet.adapters.ndjson import iter_ndjson_transactions, parse_ndjson_record
+from hedix_wallet.wallet import make_wallet
+
+
+class TestNdjsonAdapter:
+    def test_parses_numbers_as_exact_decimals(self) -> None:
+        tx = parse_ndjson_record('{"type": "DEPOSIT", "asset": "BTC", "amount": 0.1}')
+        assert tx == {"type": "DEPOSIT", "asset": "BTC", "amount": Decimal("0.1")}
+        assert str(tx["amount"]) == "0.1"
+
+    def test_accepts_string_and_integer_amounts_case_insensitively(self) -> None:
+        lines = [
+            '{"type": "deposit", "asset": "usd", "amount": "1000.50"}\n',
+            "\n",
+            '{"type": "WITHDRAW", "asset": "USD", "amount": 300, "id": 7}\n',
+        ]
+        txs = list(iter_ndjson_transactions(lines))
+        assert [tx["type"] for tx in txs] == ["DEPOSIT", "WITHDRAW"]
+        assert [tx["amount"] for tx in txs] == [Decimal("1000.50"), Decimal("300")]
+
+    def test_reuses_asset_and_amount_validation(self) -> None:
+        with pytest.raises(ValueError, match="Invalid asset"):
+            parse_ndjson_record('{"type": "DEPOSIT", "asset": "XRP", "amount": 1}')
+        with pytest.raises(ValueError, match="must be positive"):
+            parse_ndjson_record('{"type": "DEPOSIT", "asset": "BTC", "amount": -1}')
+        with pytest.raises(ValueError, match="Invalid amount"):
+            parse_ndjson_record('{"type": "DEPOSIT", "asset": "BTC", "amount": true}')
+
+    def test_rejects_malformed_records_with_line_number(self) -> None:
+        lines = ['{"type": "DEPOSIT", "asset": "BTC", "amount": 1}', '{"type": "DEPOSIT"}']
+        with pytest.raises(ValueError, match=r"line 2: Invalid record: missing field 'asset'"):
+            list(iter_ndjson_transactions(lines))
+        with pytest.raises(ValueError, match="line 1"):
+            list(iter_ndjson_transactions(["not json"]))
+
+    def test_streams_lazily_into_process(self) -> None:
+        consumed = 0
+
+        def lines() -> Iterator[str]:
+            nonlocal consumed
+            for _ in range(3):
+                consumed += 1
+                yield '{"type": "DEPOSIT", "asset": "ETH", "amount": 2.5}'
+
+        txs = iter_ndjson_transactions(lines())
+        assert consumed == 0
+        _, _, _, process = make_wallet()
+        assert process(txs)["ETH"] == Decimal("7.5")
+        assert consumed == 3
+
+
+class TestCsvAdapter:
+    def test_header_columns_in_any_order(self) -> None:
+        lines = ["Amount,Asset,Type,note\n", "1.5,btc,deposit,a\n", "\n", "2.0,BTC,WITHDRAW,b\n"]
+        txs = list(iter_csv_transactions(lines))
+        assert txs == [
+            {"type": "DEPOSIT", "asset": "BTC", "amount": Decimal("1.5")},
+            {"type": "WITHDRAW", "asset": "BTC", "amount": Decimal("2.0")},
+        ]
+
+    def test_explicit_fieldnames_without_header(self) -> None:
+        txs = list(
+            iter_csv_transactions(["DEPOSIT,USD,10\n"], fieldnames=["type", "asset", "amount"])
+        )
+        assert txs == [{"type": "DEPOSIT", "asset": "USD", "amount": Decimal("10")}]
+
+    def test_empty_input_yields_nothing(self) -> None:
+        assert list(iter_csv_transactions([])) == []
+
+    def test_missing_header_column_raises(self) -> None:
+        with pytest.raises(ValueError, match="line 1: CSV header must contain"):
+            list(iter_csv_transactions(["type,asset\n", "DEPOSIT,BTC\n"]))
+
+    def test_invalid_rows_report_line_number(self) -> None:
+        lines = ["type,asset,amount\n", "DEPOSIT,BTC,1\n", "DEPOSIT,BTC\n"]
+        with pytest.raises(ValueError, match="line 3: Invalid row"):
+            list(iter_csv_transactions(lines))
+        with pytest.raises(ValueError, match="line 2: Invalid amount"):
+            list(iter_csv_transactions(["type,asset,amount\n", "DEPOSIT,BTC,abc\n"]))
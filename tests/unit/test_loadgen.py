@@ -0,0 +1,131 @@
+"""Unit tests for the synthetic workload generator."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from hedix_wallet.adapters import loadgen
+from hedix_wallet.adapters.loadgen import (
+    LoadProfile,
+    default_profile,
+    make_load_generator,
+    parse_distribution,
+    parse_weights,
+)
+from hedix_wallet.main import iter_input
+from hedix_wallet.wallet import make_stats, make_wallet
+
+
+def _generate(
+    count: int, output_format: str = "text", seed: int = 0, profile: LoadProfile | None = None
+) -> str:
+    generate, _ = make_load_generator(profile, seed=seed, output_format=output_format)
+    return b"".join(generate(count, chunk_rows=97)).decode("ascii")
+
+
+def _replay(text: str, output_format: str = "text") -> tuple[int, int]:
+    observe, stats, _ = make_stats()
+    _, _, _, process = make_wallet(engine="inplace")
+    process(iter_input(output_format, text.splitlines(keepends=True)), observe)
+    totals = stats().values()
+    return (
+        sum(entry["withdraw_count"] + entry["failed_withdraw_count"] for entry in totals),
+        sum(entry["failed_withdraw_count"] for entry in totals),
+    )
+
+
+class TestLoadGenerator:
+    def test_same_seed_gives_identical_output(self) -> None:
+        assert _generate(2000, seed=42) == _generate(2000, seed=42)
+        assert _generate(2000, seed=42) != _generate(2000, seed=43)
+
+    @pytest.mark.parametrize("output_format", ["text", "ndjson", "csv"])
+    def test_successive_calls_continue_the_stream(self, output_format: str) -> None:
+        generate, _ = make_load_generator(seed=5, output_format=output_format)
+        split = b"".join(generate(300)) + b"".join(generate(9000))
+        assert split.decode("ascii") == _generate(9300, output_format, seed=5)
+
+    @pytest.mark.parametrize("output_format", ["text", "ndjson", "csv"])
+    def test_formats_decode_to_the_same_transactions(self, output_format: str) -> None:
+        expected = list(iter_input("text", _generate(9000, seed=1).splitlines()))
+        decoded = list(
+            iter_input(output_format, _generate(9000, output_format, seed=1).splitlines())
+        )
+        assert decoded == expected
+
+    @pytest.mark.parametrize("fail_rate", [0.0, 0.1, 0.3])
+    def test_summary_matches_replay_and_target_rate(self, fail_rate: float) -> None:
+        profile = default_profile()
+        profile["fail_rate"] = fail_rate
+        generate, summary = make_load_generator(profile, seed=9)
+        text = b"".join(generate(20_000)).decode("ascii")
+        withdrawals, failed = _replay(text)
+        totals = summary()
+        assert totals["transactions"] == len(text.splitlines()) == 20_000
+        assert (totals["withdrawals"], totals["failed_withdrawals"]) == (withdrawals, failed)
+        assert failed / withdrawals == pytest.approx(fail_rate, abs=0.01)
+
+    def test_profile_shapes_mix_ratio_and_amounts(self) -> None:
+        profile: LoadProfile = {
+            "asset_weights": parse_weights("ETH=3,USD=1"),
+            "withdraw_ratio": 0.25,
+            "fail_rate": 0.0,
+            "amounts": {
+                "ETH": parse_distribution("uniform:0.5:1.5"),
+                "USD": parse_distribution("fixed:20"),
+            },
+            "places": {"ETH": 3, "USD": 0},
+        }
+        transactions = list(iter_input("text", _generate(8000, profile=profile).splitlines()))
+        eth = [tx for tx in transactions if tx["asset"] == "ETH"]
+        deposits = [tx for tx in transactions if tx["type"] == "DEPOSIT"]
+        assert not [tx for tx in transactions if tx["asset"] == "BTC"]
+        assert len(eth) / len(transactions) == pytest.approx(0.75, abs=0.03)
+        assert len(deposits) / len(transactions) == pytest.approx(0.75, abs=0.03)
+        assert all(Decimal("0.5") <= tx["amount"] <= Decimal("1.5") for tx in deposits if tx in eth)
+        assert {tx["amount"] for tx in deposits if tx["asset"] == "USD"} == {Decimal("20")}
+        assert all(tx["amount"].as_tuple().exponent == -3 for tx in eth)
+
+    def test_reused_templates_vary_amounts_and_keep_outcomes_exact(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(loadgen, "TEMPLATE_POOL_SIZE", 2)
+        monkeypatch.setattr(loadgen, "TEMPLATE_REFRESH_BLOCKS", 1_000_000)
+        generate, summary = make_load_generator(seed=3)
+        text = b"".join(generate(loadgen.BLOCK_ROWS * 12)).decode("ascii")
+        amounts = [line.split()[2] for line in text.splitlines() if line.startswith("DEPOSIT BTC")]
+        assert len(set(amounts)) > 0.95 * len(amounts)
+        totals = summary()
+        assert (totals["withdrawals"], totals["failed_withdrawals"]) == _replay(text)
+
+    def test_csv_output_starts_with_header(self) -> None:
+        assert _generate(3, "csv").startswith("type,asset,amount\n")
+
+    @pytest.mark.parametrize(
+        "spec",
+        ["gauss:1:2", "uniform:2:1", "fixed:0", "lognormal:1", "uniform:a:b"],
+    )
+    def test_invalid_distributions_are_rejected(self, spec: str) -> None:
+        with pytest.raises(ValueError, match="Invalid amount distribution"):
+            parse_distribution(spec)
+
+    def test_invalid_profiles_are_rejected(self) -> None:
+        profile = default_profile()
+        profile["fail_rate"] = 1.5
+        with pytest.raises(ValueError, match="fail_rate"):
+            make_load_generator(profile)
+        with pytest.raises(ValueError, match="Invalid asset"):
+            parse_weights("DOGE=1")
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            make_load_generator(output_format="xml")
+        profile = default_profile()
+        del profile["amounts"]["ETH"]
+        with pytest.raises(ValueError, match="Missing amount distribution"):
+            make_load_generator(profile)
+
+    def test_generate_validates_before_iteration(self) -> None:
+        generate, _ = make_load_generator()
+        with pytest.raises(ValueError, match="count must be >= 0"):
+            generate(-1)
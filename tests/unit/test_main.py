@@ -0,0 +1,137 @@
+"""Unit tests for the `wallet` command line entry point."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from hedix_wallet import engines
+from hedix_wallet.domain.digest import hash_balances
+from hedix_wallet.domain.types import Balances
+from hedix_wallet.engines import BulkWalletFuncs
+from hedix_wallet.main import main
+
+
+class TestMain:
+    def test_no_command_runs_example(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main([]) == 0
+        assert "Expected Output: BTC: 1.0, ETH: 5.0, USD: 700" in capsys.readouterr().out
+
+    def test_process_prints_final_balances(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        source = tmp_path / "txs.txt"
+        source.write_text("# header\nDEPOSIT BTC 1.5\n\nWITHDRAW BTC 2.0\nDEPOSIT USD 10\n")
+        assert main(["process", str(source)]) == 0
+        assert capsys.readouterr().out == "BTC: 1.5, ETH: 0, USD: 10\n"
+
+    def test_process_reports_line_number_of_invalid_input(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        source = tmp_path / "txs.txt"
+        source.write_text("DEPOSIT BTC 1\nDEPOSIT XRP 1\n")
+        assert main(["process", str(source)]) == 1
+        assert "line 2: Invalid asset" in capsys.readouterr().err
+
+    def test_process_engine_choices_come_from_the_registry(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        with pytest.raises(SystemExit):
+            main(["process", "--help"])
+        assert "{auto,inplace,reference}" in capsys.readouterr().out
+        with pytest.raises(SystemExit) as excinfo:
+            main(["process", "--engine", "turbo"])
+        assert excinfo.value.code == 2
+        assert "invalid choice: 'turbo'" in capsys.readouterr().err
+
+    def test_process_rejects_zero_workers(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        source = tmp_path / "txs.txt"
+        source.write_text("DEPOSIT BTC 1\n")
+        assert main(["process", "--workers", "0", str(source)]) == 1
+        assert "wallet: workers must be positive, got 0" in capsys.readouterr().err
+
+    def test_process_reports_out_of_range_amount(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        source = tmp_path / "txs.txt"
+        source.write_text("DEPOSIT BTC 1e999999999\n")
+        assert main(["process", str(source)]) == 1
+        assert "wallet: amount out of range (Overflow)" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        ("input_format", "content"),
+        [
+            ("ndjson", '{"type": "DEPOSIT", "asset": "ETH", "amount": 5.0}\n'),
+            ("csv", "type,asset,amount\nDEPOSIT,ETH,5.0\n"),
+        ],
+    )
+    def test_process_structured_formats(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        input_format: str,
+        content: str,
+    ) -> None:
+        source = tmp_path / f"txs.{input_format}"
+        source.write_text(content)
+        assert main(["process", "--format", input_format, str(source)]) == 0
+        assert capsys.readouterr().out == "BTC: 0, ETH: 5.0, USD: 0\n"
+
+    def test_loadgen_output_round_trips_through_process(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        target = tmp_path / "load.csv"
+        args = ["loadgen", "-n", "500", "--seed", "7", "--format", "csv", "-o", str(target)]
+        assert main([*args, "--mix", "BTC=1,USD=1", "--amount", "USD=uniform:1:50"]) == 0
+        assert "wallet loadgen: 500 transactions" in capsys.readouterr().err
+        assert main(["process", "--format", "csv", str(target)]) == 0
+        assert capsys.readouterr().out.startswith("BTC: ")
+
+    def test_loadgen_keeps_existing_output_on_invalid_arguments(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        target = tmp_path / "load.txt"
+        target.write_text("DEPOSIT BTC 1\n")
+        assert main(["loadgen", "-n", "-1", "-o", str(target)]) == 1
+        assert main(["loadgen", "--mix", "BTC=1", "--places", "BTC=-1", "-o", str(target)]) == 1
+        assert "count must be >= 0" in capsys.readouterr().err
+        assert target.read_text() == "DEPOSIT BTC 1\n"
+
+    def test_loadgen_rejects_invalid_distribution(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["loadgen", "-n", "1", "--amount", "BTC=normal:1:2"]) == 1
+        assert "Invalid amount distribution" in capsys.readouterr().err
+
+    def test_process_digest_matches_across_engines(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        source = tmp_path / "txs.txt"
+        source.write_text("DEPOSIT BTC 1.5\nWITHDRAW BTC 2.0\nDEPOSIT USD 10\n")
+        outputs = []
+        for engine in ("reference", "inplace"):
+            assert main(["process", "--digest", "--stats", "--engine", engine, str(source)]) == 0
+            outputs.append(capsys.readouterr().out.splitlines()[-1])
+        assert outputs[0] == outputs[1]
+        assert outputs[0].startswith("digest: offset 3 stream ")
+
+    def test_process_digest_hashes_the_engine_balances(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(engines, "_ENGINES", dict(engines._ENGINES))
+        skewed: Balances = {"BTC": Decimal("9"), "ETH": Decimal("9"), "USD": Decimal("9")}
+
+        def skewed_engine(initial: Balances | None) -> BulkWalletFuncs:
+            deposit, withdraw, _, process, deposit_many, withdraw_many = (
+                engines.make_reference_wallet(initial)
+            )
+            return deposit, withdraw, lambda: skewed, process, deposit_many, withdraw_many
+
+        engines.register_engine("skewed", skewed_engine)
+        source = tmp_path / "txs.txt"
+        source.write_text("DEPOSIT BTC 1.5\n")
+        assert main(["process", "--digest", "--stats", "--engine", "skewed", str(source)]) == 0
+        line = capsys.readouterr().out.splitlines()[-1]
+        assert line.endswith(f"balances {hash_balances(skewed).hex()}")
@@ -0,0 +1,99 @@
+"""Unit tests for the single-pass statistics aggregator."""
+
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+from typing import cast
+
+import pytest
+
+from hedix_wallet.domain.reducers import compute_balances
+from hedix_wallet.domain.stats import SKETCH_RELATIVE_ACCURACY, make_stats
+from hedix_wallet.domain.types import Balances, PositiveDecimal, Transaction
+from hedix_wallet.wallet import make_wallet
+
+EXAMPLE: list[Transaction] = [
+    {"type": "DEPOSIT", "asset": "BTC", "amount": cast(PositiveDecimal, Decimal("1.5"))},
+    {"type": "DEPOSIT", "asset": "USD", "amount": cast(PositiveDecimal, Decimal("1000"))},
+    {"type": "WITHDRAW", "asset": "USD", "amount": cast(PositiveDecimal, Decimal("300"))},
+    {"type": "WITHDRAW", "asset": "BTC", "amount": cast(PositiveDecimal, Decimal("2.0"))},
+    {"type": "DEPOSIT", "asset": "ETH", "amount": cast(PositiveDecimal, Decimal("5.0"))},
+    {"type": "WITHDRAW", "asset": "BTC", "amount": cast(PositiveDecimal, Decimal("0.5"))},
+]
+
+
+class TestStats:
+    def test_counts_volumes_and_failures_in_same_pass(self) -> None:
+        observe, stats, _ = make_stats()
+        _, _, _, process = make_wallet()
+        balances = process(EXAMPLE, observe)
+
+        btc = stats()["BTC"]
+        assert btc["deposit_count"] == 1
+        assert btc["deposit_volume"] == Decimal("1.5")
+        assert btc["withdraw_count"] == 1
+        assert btc["withdraw_volume"] == Decimal("0.5")
+        assert btc["failed_withdraw_count"] == 1
+        assert btc["failed_withdraw_volume"] == Decimal("2.0")
+        assert btc["max_balance"] == Decimal("1.5")
+        assert btc["min_balance"] == Decimal("0")
+        assert {asset: entry["balance"] for asset, entry in stats().items()} == balances
+
+    def test_min_balance_starts_from_initial_balances(self) -> None:
+        observe, stats, _ = make_stats({"USD": Decimal("50")})
+        _, _, _, process = make_wallet({"USD": Decimal("50")})
+        process(
+            [
+                {"type": "WITHDRAW", "asset": "USD", "amount": Decimal("45")},
+                {"type": "DEPOSIT", "asset": "USD", "amount": Decimal("100")},
+            ],
+            observe,
+        )
+        usd = stats()["USD"]
+        assert usd["min_balance"] == Decimal("5")
+        assert usd["max_balance"] == Decimal("105")
+
+    def test_compute_balances_reports_outcomes(self) -> None:
+        observe, stats, _ = make_stats()
+        initial: Balances = {"BTC": Decimal("0"), "ETH": Decimal("0"), "USD": Decimal("0")}
+        result = compute_balances(initial, EXAMPLE, observe)
+        assert result["BTC"] == Decimal("1.0")
+        assert stats()["BTC"]["failed_withdraw_count"] == 1
+        assert stats()["USD"]["withdraw_count"] == 1
+
+    def test_quantiles_are_within_relative_accuracy(self) -> None:
+        rng = random.Random(7)
+        observe, stats, quantile = make_stats()
+        samples = sorted(Decimal(f"{rng.lognormvariate(3, 2):.8f}") + 1 for _ in range(5000))
+        for amount in samples:
+            observe({"type": "DEPOSIT", "asset": "ETH", "amount": amount}, True)
+
+        for q in (0.0, 0.25, 0.5, 0.9, 0.99, 1.0):
+            exact = float(samples[int(q * (len(samples) - 1))])
+            estimate = quantile("ETH", "DEPOSIT", q)
+            assert estimate is not None
+            assert abs(estimate - exact) <= exact * SKETCH_RELATIVE_ACCURACY * 1.01
+        assert set(stats()["ETH"]["deposit_quantiles"]) == {0.5, 0.9, 0.99}
+
+    def test_quantile_without_samples_is_none_and_range_is_checked(self) -> None:
+        _, stats, quantile = make_stats()
+        assert quantile("BTC", "WITHDRAW", 0.5) is None
+        assert stats()["BTC"]["withdraw_quantiles"][0.5] is None
+        with pytest.raises(ValueError, match="Quantile"):
+            quantile("BTC", "WITHDRAW", 1.5)
+
+    def test_extreme_magnitudes_stay_queryable(self) -> None:
+        observe, _, quantile = make_stats()
+        for exponent in range(-400, 400, 7):
+            amount = Decimal(f"1e{exponent}")
+            observe({"type": "DEPOSIT", "asset": "BTC", "amount": amount}, True)
+        high = quantile("BTC", "DEPOSIT", 1.0)
+        assert high is not None and high > 1e300
+
+    def test_stats_snapshot_is_a_copy(self) -> None:
+        observe, stats, _ = make_stats()
+        observe(EXAMPLE[0], True)
+        snapshot = stats()
+        snapshot["BTC"]["deposit_count"] = 99
+        assert stats()["BTC"]["deposit_count"] == 1
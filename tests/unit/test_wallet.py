@@ -1,10 +1,11 @@
 """Unit tests for the functional wallet closure."""
 
+import random
 from decimal import Decimal
 
 import pytest
 
-from hedix_wallet.wallet import format_balances, make_wallet
+from hedix_wallet.wallet import format_balances, make_bulk_wallet, make_wallet
 
 
 class TestFunctionalWallet:
@@ -60,3 +61,60 @@ class TestFunctionalWallet:
         assert "BTC: 1.5" in formatted
         assert "ETH: 5.0" in formatted
         assert "USD: 700" in formatted
+
+
+class TestBulkOperations:
+    def test_deposit_many_accumulates_into_one_asset(self) -> None:
+        _, _, snapshot, _, deposit_many, _ = make_bulk_wallet()
+        deposit_many("BTC", [Decimal("1.0"), Decimal("0.5"), Decimal("0.25")])
+        assert snapshot() == {"BTC": Decimal("1.75"), "ETH": Decimal("0"), "USD": Decimal("0")}
+
+    def test_withdraw_many_returns_compact_success_array(self) -> None:
+        deposit, _, snapshot, _, _, withdraw_many = make_bulk_wallet()
+        deposit("USD", Decimal("10"))
+        results = withdraw_many("USD", [Decimal("4"), Decimal("7"), Decimal("6"), Decimal("1")])
+        assert isinstance(results, bytearray)
+        assert list(results) == [1, 0, 1, 0]
+        assert snapshot()["USD"] == Decimal("0")
+
+    def test_empty_sequences_are_no_ops(self) -> None:
+        _, _, snapshot, _, deposit_many, withdraw_many = make_bulk_wallet()
+        deposit_many("BTC", [])
+        assert withdraw_many("BTC", []) == bytearray()
+        assert snapshot()["BTC"] == Decimal("0")
+
+    def test_invalid_amount_keeps_preceding_amounts_applied(self) -> None:
+        _, _, snapshot, _, deposit_many, withdraw_many = make_bulk_wallet()
+        with pytest.raises(ValueError, match="positive"):
+            deposit_many("ETH", [Decimal("2"), Decimal("3"), Decimal("0"), Decimal("100")])
+        assert snapshot()["ETH"] == Decimal("5")
+        with pytest.raises(ValueError, match="positive"):
+            withdraw_many("ETH", [Decimal("1"), Decimal("-1")])
+        assert snapshot()["ETH"] == Decimal("4")
+
+    def test_bulk_matches_sequential_calls_exactly(self) -> None:
+        rng = random.Random(3)
+        amounts = [
+            Decimal(rng.randint(1, 10**9)).scaleb(-rng.choice((0, 2, 8, 18))) for _ in range(500)
+        ]
+        initial = {"BTC": Decimal("123456789012.5")}
+        _, _, bulk_snapshot, _, deposit_many, withdraw_many = make_bulk_wallet(initial)
+        seq_deposit, seq_withdraw, seq_snapshot, _, _, _ = make_bulk_wallet(initial)
+
+        deposit_many("BTC", amounts[:250])
+        for amount in amounts[:250]:
+            seq_deposit("BTC", amount)
+        results = withdraw_many("BTC", amounts[250:] * 4)
+        expected = [seq_withdraw("BTC", amount) for amount in amounts[250:] * 4]
+
+        assert list(results) == [int(ok) for ok in expected]
+        assert str(bulk_snapshot()["BTC"]) == str(seq_snapshot()["BTC"])
+
+    def test_bulk_shares_state_and_keeps_snapshots_isolated(self) -> None:
+        deposit, withdraw, snapshot, process, deposit_many, _ = make_bulk_wallet()
+        deposit("BTC", Decimal("1"))
+        before = snapshot()
+        deposit_many("BTC", [Decimal("1")] * 3)
+        assert before["BTC"] == Decimal("1")
+        assert withdraw("BTC", Decimal("4")) is True
+        assert process([])["BTC"] == Decimal("0")